@@ -52,7 +52,7 @@ def resume_crashed(slots: int, active: list[Spawn]) -> int:
     resumed = 0
     limit = min(slots, MAX_RESUME_PER_TICK)
     for s in crashed[:limit]:
-        agent = agents.get(s.agent_id)
+        agent = agent_map.get(s.agent_id)
         if not agent or not agent.model or agent.archived_at:
             continue
         try:
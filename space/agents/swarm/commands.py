@@ -383,8 +383,8 @@ def _continue(
             echo("no crashed spawns")
         return
 
+    agent_map = agents.batch_get([s.agent_id for s in crashed])
     if dry_run:
-        agent_map = agents.batch_get(list({s.agent_id for s in crashed}))
         lines = []
         for s in crashed:
             a = agent_map.get(s.agent_id)
@@ -397,7 +397,10 @@ def _continue(
 
     resumed: list[dict[str, str]] = []
     for s in crashed[:limit]:
-        agent_obj = agents.get(s.agent_id)
+        agent_obj = agent_map.get(s.agent_id)
+        if not agent_obj:
+            echo(f"Failed: {store.ref('spawns', s.id)} - agent not found")
+            continue
         try:
             spawn.launch(agent_id=agent_obj.id, spawn=s)
             resumed.append({"id": s.id, "handle": agent_obj.handle})
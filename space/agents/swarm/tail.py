@@ -1,7 +1,11 @@
+import functools
+import hashlib
 import json
+import os
 import random
-import tempfile
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -15,19 +19,49 @@ from space.lib import paths, providers, trace
 from space.lib.display import ansi, format_nameplate
 from space.lib.parser import extract_cd
 from space.lib.providers import base as provider_base
+from space.lib.store.connection import resolve_db_path
 
 _STALE_THRESHOLD_SECONDS = 120
+_SYNC_CHECK_SECONDS = 1.0
+_SYNC_FALLBACK_SECONDS = 5.0
+_IDLE_SKIP_MAX_TICKS = 9
 
-_RENDER_CACHE: dict[Path, tuple[float, list[tuple[str, str]]]] = {}
+_RENDER_CACHE_MAX = 1000
+_RENDER_CACHE: OrderedDict[
+    Path, tuple[tuple[float, str, str | None], list[tuple[str, str]]]
+] = OrderedDict()
 
 
 def _resolve_handle(agent_id: str, cache: dict[str, str]) -> str:
+    if (handle := cache.get(agent_id)) is not None:
+        return handle
+    agent = agents_mod.get(AgentId(agent_id))
+    handle = cache[agent_id] = agent.handle if agent else agent_id[:8]
+    return handle
+
+
+def _resolve_model(agent_id: str, cache: dict[str, str | None]) -> str | None:
     if agent_id not in cache:
         agent = agents_mod.get(AgentId(agent_id))
-        cache[agent_id] = agent.handle if agent else agent_id[:8]
+        cache[agent_id] = agent.model if agent else None
     return cache[agent_id]
 
 
+def _prime_agents(
+    spawn_list: list[Spawn],
+    agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
+) -> None:
+    missing = [
+        AgentId(s.agent_id)
+        for s in spawn_list
+        if s.agent_id not in agent_cache or s.agent_id not in model_cache
+    ]
+    for agent_id, agent in agents_mod.batch_get(missing).items():
+        agent_cache[agent_id] = agent.handle
+        model_cache[agent_id] = agent.model
+
+
 @dataclass
 class StreamState:
     spawn_id: str
@@ -44,11 +78,17 @@ class StreamState:
     shown_starting: bool = False
     lines_read: int = 0
     cwd: str | None = None
+    idle_ticks: int = 0
+    skip_ticks: int = 0
 
 
-def spawn_path(s, agent_cache: dict[str, str]) -> Path | None:
-    agent = agents_mod.get(s.agent_id)
-    provider = providers.map(agent.model) if agent and agent.model else "claude"
+def spawn_path(
+    s,
+    agent_cache: dict[str, str],
+    model_cache: dict[str, str | None] | None = None,
+) -> Path | None:
+    model = _resolve_model(s.agent_id, model_cache if model_cache is not None else {})
+    provider = providers.map(model) if model else "claude"
     p = paths.dot_space() / "spawns" / provider / f"{s.id}.jsonl"
     if p.exists():
         return p
@@ -60,6 +100,7 @@ estimate_ctx_pct = events.estimate_ctx_pct
 input_tokens_from_event = events.input_tokens
 
 
+@functools.lru_cache(maxsize=2048)
 def _local_date(iso_ts: str | None) -> date | None:
     if not iso_ts:
         return None
@@ -94,55 +135,77 @@ def _format_resume_event(ident: str) -> str:
     )
 
 
+def _tool_entry(
+    ev: dict[str, object], sid8: str, ident: str, ctx: int | None
+) -> dict[str, object] | None:
+    return {
+        "spawn": sid8,
+        "agent": ident,
+        "entry_type": "tool",
+        "name": ev.get("name"),
+        "args": str(ev.get("arguments", "")),
+        "ctx_pct": ctx,
+        "content": None,
+    }
+
+
+def _text_entry(
+    ev: dict[str, object], sid8: str, ident: str, ctx: int | None
+) -> dict[str, object] | None:
+    content = ev.get("content")
+    if not content:
+        return None
+    return {
+        "spawn": sid8,
+        "agent": ident,
+        "entry_type": "text",
+        "content": str(content),
+        "name": None,
+        "args": None,
+        "ctx_pct": ctx,
+    }
+
+
+def _result_entry(
+    ev: dict[str, object], sid8: str, ident: str, ctx: int | None
+) -> dict[str, object] | None:
+    return {
+        "spawn": sid8,
+        "agent": ident,
+        "entry_type": "result",
+        "name": ev.get("name"),
+        "content": str(ev.get("content", "")),
+        "args": None,
+        "ctx_pct": ctx,
+    }
+
+
+_ENTRY_BUILDERS: dict[object, Callable[..., dict[str, object] | None]] = {
+    "tool_call": _tool_entry,
+    "text": _text_entry,
+    "tool_result": _result_entry,
+}
+
+
 def _event_to_entry(
     ev: dict[str, object],
-    spawn_id: str,
+    sid8: str,
     ident: str,
     ctx_pct: float | None,
 ) -> dict[str, object] | None:
-    etype = ev.get("type")
-    if etype == "tool_call":
-        return {
-            "spawn": spawn_id[:8],
-            "agent": ident,
-            "entry_type": "tool",
-            "name": ev.get("name"),
-            "args": str(ev.get("arguments", "")),
-            "ctx_pct": int(ctx_pct) if ctx_pct is not None else None,
-            "content": None,
-        }
-    if etype == "text":
-        content = ev.get("content")
-        if content:
-            return {
-                "spawn": spawn_id[:8],
-                "agent": ident,
-                "entry_type": "text",
-                "content": str(content),
-                "name": None,
-                "args": None,
-                "ctx_pct": int(ctx_pct) if ctx_pct is not None else None,
-            }
-    if etype == "tool_result":
-        return {
-            "spawn": spawn_id[:8],
-            "agent": ident,
-            "entry_type": "result",
-            "name": ev.get("name"),
-            "content": str(ev.get("content", "")),
-            "args": None,
-            "ctx_pct": int(ctx_pct) if ctx_pct is not None else None,
-        }
-    return None
+    build = _ENTRY_BUILDERS.get(ev.get("type"))
+    if build is None:
+        return None
+    return build(ev, sid8, ident, int(ctx_pct) if ctx_pct is not None else None)
 
 
 def fetch_spawn_entries(
     s,
     agent_cache: dict[str, str],
+    model_cache: dict[str, str | None] | None = None,
 ) -> list[tuple[str, dict[str, object]]]:
     ident = _resolve_handle(s.agent_id, agent_cache)
-    agent_obj = agents_mod.get(s.agent_id)
-    model = agent_obj.model if agent_obj else None
+    model = _resolve_model(s.agent_id, model_cache if model_cache is not None else {})
     path = spawn_path_by_id(s.id)
     if not path:
         return []
@@ -151,6 +214,7 @@ def fetch_spawn_entries(
         providers.get_provider(provider) if provider in providers.PROVIDER_NAMES else None
     )
     tool_map: dict[str, str] = {}
+    sid8 = s.id[:8]
 
     timed: list[tuple[str, dict[str, object]]] = []
     ctx_pct: float | None = None
@@ -167,13 +231,18 @@ def fetch_spawn_entries(
                     ctx_limit = providers.models.context_limit(model or "")
                     ctx_pct = max(0, 100 - inp / ctx_limit * 100)
                 events: list[dict[str, object]] = [raw]
-                if provider_cls and raw.get("type") not in ("assistant", "result"):
-                    normalized = provider_cls.normalize_event(raw, ident, tool_map)
+                rtype = raw.get("type")
+                if provider_cls and rtype not in ("assistant", "result"):
+                    normalized = (
+                        provider_cls.normalize_event(raw, ident, tool_map)
+                        if rtype in provider_cls.NORMALIZED_TYPES
+                        else None
+                    )
                     events = normalized if normalized else []
                 for ev in events:
                     event_ts = ev.get("timestamp") or ts
                     ts_str = event_ts if isinstance(event_ts, str) else ""
-                    entry = _event_to_entry(ev, s.id, ident, ctx_pct)
+                    entry = _event_to_entry(ev, sid8, ident, ctx_pct)
                     if entry:
                         timed.append((ts_str, entry))
             except json.JSONDecodeError:
@@ -181,31 +250,13 @@ def fetch_spawn_entries(
     return timed
 
 
-def parse_spawn_file(
-    s,
-    agent_cache: dict[str, str],
-) -> list[tuple[str, str]]:
-    ident = _resolve_handle(s.agent_id, agent_cache)
-    agent_obj = agents_mod.get(s.agent_id)
-    model = agent_obj.model if agent_obj else None
-    path = spawn_path_by_id(s.id)
-    if not path:
-        return []
-
-    mtime = path.stat().st_mtime
-    if path in _RENDER_CACHE:
-        cached_mtime, cached_data = _RENDER_CACHE.pop(path)
-        if cached_mtime == mtime:
-            _RENDER_CACHE[path] = (cached_mtime, cached_data)
-            return cached_data
-
+def _iter_rendered(path: Path, ident: str, model: str | None) -> Iterator[tuple[str, str]]:
     provider = path.parent.name
     provider_cls = (
         providers.get_provider(provider) if provider in providers.PROVIDER_NAMES else None
     )
     tool_map: dict[str, str] = {}
 
-    timed: list[tuple[str, str]] = []
     ctx_pct: float | None = None
     with path.open() as f:
         for line in f:
@@ -217,13 +268,11 @@ def parse_spawn_file(
                 ts = raw.get("timestamp") or ""
 
                 if raw.get("type") == "daemon":
-                    timed.append(
-                        (ts, _format_daemon_event(ident, raw.get("action", ""), raw.get("reason")))
-                    )
+                    yield ts, _format_daemon_event(ident, raw.get("action", ""), raw.get("reason"))
                     continue
 
                 if raw.get("type") == "context_init" and raw.get("context_case") == "RESUME":
-                    timed.append((ts, _format_resume_event(ident)))
+                    yield ts, _format_resume_event(ident)
                     continue
 
                 inp = input_tokens_from_event(raw, provider)
@@ -231,40 +280,93 @@ def parse_spawn_file(
                     ctx_limit = providers.models.context_limit(model or "")
                     ctx_pct = max(0, 100 - inp / ctx_limit * 100)
                 events: list[dict[str, object]] = [raw]
-                if provider_cls and raw.get("type") not in ("assistant", "result"):
-                    normalized = provider_cls.normalize_event(raw, ident, tool_map)
+                rtype = raw.get("type")
+                if provider_cls and rtype not in ("assistant", "result"):
+                    normalized = (
+                        provider_cls.normalize_event(raw, ident, tool_map)
+                        if rtype in provider_cls.NORMALIZED_TYPES
+                        else None
+                    )
                     events = normalized if normalized else []
                 for ev in events:
                     event_ts = ev.get("timestamp") or ts
                     ts_str = event_ts if isinstance(event_ts, str) else ""
-                    timed.extend(
-                        (ts_str, fmt)
-                        for fmt in trace.format_event_multi(ev, ident, ctx_pct, tool_map=tool_map)
-                    )
+                    for fmt in trace.format_event_multi(ev, ident, ctx_pct, tool_map=tool_map):
+                        yield ts_str, fmt
             except json.JSONDecodeError:
                 pass
 
-    _RENDER_CACHE[path] = (mtime, timed)
-    if len(_RENDER_CACHE) > 1000:
-        _RENDER_CACHE.pop(next(iter(_RENDER_CACHE)))
-    return timed
 
+def parse_spawn_file(
+    s,
+    agent_cache: dict[str, str],
+    model_cache: dict[str, str | None] | None = None,
+) -> list[tuple[str, str]]:
+    ident = _resolve_handle(s.agent_id, agent_cache)
+    model = _resolve_model(s.agent_id, model_cache if model_cache is not None else {})
+    path = spawn_path_by_id(s.id)
+    if not path:
+        return []
 
-def generate_tail(target_date: date) -> list[str]:
-    agent_cache: dict[str, str] = {}
+    key = (path.stat().st_mtime, ident, model)
+    cached = _RENDER_CACHE.get(path)
+    if cached and cached[0] == key:
+        _RENDER_CACHE.move_to_end(path)
+        return cached[1]
+
+    timed = list(_iter_rendered(path, ident, model))
+
+    _RENDER_CACHE[path] = (key, timed)
+    _RENDER_CACHE.move_to_end(path)
+    if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+        _RENDER_CACHE.popitem(last=False)
+    return timed
 
+
+def _day_spawns(target_date: date) -> list[Spawn]:
     all_spawns = spawn.fetch(limit=500)
-    day_spawns = [s for s in all_spawns if _local_date(s.created_at) == target_date]
+    return [s for s in all_spawns if _local_date(s.created_at) == target_date]
 
-    if not day_spawns:
-        return []
 
+def _render_tail(
+    day_spawns: list[Spawn],
+    agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
+) -> list[str]:
+    _prime_agents(day_spawns, agent_cache, model_cache)
     timed: list[tuple[str, str]] = []
     for s in day_spawns:
-        timed.extend(parse_spawn_file(s, agent_cache))
+        timed.extend(parse_spawn_file(s, agent_cache, model_cache))
 
     timed.sort(key=lambda t: t[0])
-    return [ansi.strip_markdown(ansi.strip(fmt)).lower() for _, fmt in timed]
+    return [ansi.plain(fmt).lower() for _, fmt in timed]
+
+
+def _tail_digest(
+    day_spawns: list[Spawn],
+    agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
+) -> str:
+    _prime_agents(day_spawns, agent_cache, model_cache)
+    h = hashlib.blake2b(digest_size=16)
+    for s in day_spawns:
+        handle = _resolve_handle(s.agent_id, agent_cache)
+        model = _resolve_model(s.agent_id, model_cache)
+        path = spawn_path_by_id(s.id)
+        try:
+            stat = path.stat() if path else None
+        except OSError:
+            stat = None
+        size, mtime = (stat.st_size, stat.st_mtime_ns) if stat else (0, 0)
+        h.update(f"{s.id}:{s.agent_id}:{handle}:{model}:{size}:{mtime}\n".encode())
+    return h.hexdigest()
+
+
+def generate_tail(target_date: date) -> list[str]:
+    day_spawns = _day_spawns(target_date)
+    if not day_spawns:
+        return []
+    return _render_tail(day_spawns, {}, {})
 
 
 def tail_dir() -> Path:
@@ -275,19 +377,50 @@ def tail_path(target_date: date) -> Path:
     return tail_dir() / f"{target_date.isoformat()}.txt"
 
 
+def _tail_meta_path(target_date: date) -> Path:
+    return tail_path(target_date).with_suffix(".meta")
+
+
+def _write_atomic(dest: Path, payload: bytes) -> None:
+    tmp = dest.with_suffix(f"{dest.suffix}.{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def save_tail(target_date: date) -> dict[str, int | str]:
-    lines = generate_tail(target_date)
+    day_spawns = _day_spawns(target_date)
+    if not day_spawns:
+        return {"lines": 0}
+
+    dest = tail_path(target_date)
+    meta = _tail_meta_path(target_date)
+    agent_cache: dict[str, str] = {}
+    model_cache: dict[str, str | None] = {}
+    digest = _tail_digest(day_spawns, agent_cache, model_cache)
+    if dest.exists():
+        try:
+            count, _, saved = meta.read_text().partition(":")
+            if saved == digest:
+                return {"lines": int(count), "path": str(dest)}
+        except (OSError, ValueError):
+            pass
+
+    lines = _render_tail(day_spawns, agent_cache, model_cache)
     if not lines:
         return {"lines": 0}
 
     out = tail_dir()
     out.mkdir(parents=True, exist_ok=True)
-    dest = tail_path(target_date)
-    with tempfile.NamedTemporaryFile("w", dir=out, delete=False) as f:
-        f.write("\n".join(lines))
-        temp_path = f.name
-
-    Path(temp_path).replace(dest)
+    _write_atomic(dest, b"\n".join(line.encode("utf-8", "replace") for line in lines))
+    _write_atomic(meta, f"{len(lines)}:{digest}".encode())
 
     return {"lines": len(lines), "path": str(dest)}
 
@@ -362,8 +495,13 @@ def read_stream(
                             t.has_real_usage = True
 
                         events: list[dict[str, object]] = [raw]
-                        if provider_cls and raw.get("type") not in ("assistant", "result"):
-                            normalized = provider_cls.normalize_event(raw, t.handle, t.tool_map)
+                        rtype = raw.get("type")
+                        if provider_cls and rtype not in ("assistant", "result"):
+                            normalized = (
+                                provider_cls.normalize_event(raw, t.handle, t.tool_map)
+                                if rtype in provider_cls.NORMALIZED_TYPES
+                                else None
+                            )
                             events = normalized if normalized else []
 
                         for ev in events:
@@ -427,6 +565,35 @@ def read_stream(
     return out
 
 
+def _line_start(path: Path, approx: int) -> int:
+    if approx == 0:
+        return 0
+    try:
+        with path.open("rb") as f:
+            f.seek(approx - 1)
+            f.readline()
+            return f.tell()
+    except OSError:
+        return approx
+
+
+def _watch_signature() -> tuple[int, ...]:
+    spawns_dir = paths.dot_space() / "spawns"
+    db_path = resolve_db_path()
+    targets = [spawns_dir, db_path.with_name(f"{db_path.name}-wal"), db_path]
+    try:
+        targets.extend(p for p in spawns_dir.iterdir() if p.is_dir())
+    except OSError:
+        pass
+    signature: list[int] = []
+    for target in targets:
+        try:
+            signature.append(target.stat().st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return tuple(signature)
+
+
 def _spawn_error(s: Spawn | None, sid: str) -> str | None:
     if s and s.error:
         return _clean_error_display(s.error)
@@ -448,10 +615,12 @@ def _clean_error_display(error: str) -> str:
 def _render_history_chronological(
     spawn_list: list[Spawn],
     agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
 ):
+    _prime_agents(spawn_list, agent_cache, model_cache)
     timed: list[tuple[str, str]] = []
     for s in spawn_list:
-        timed.extend(parse_spawn_file(s, agent_cache))
+        timed.extend(parse_spawn_file(s, agent_cache, model_cache))
     timed.sort(key=lambda t: t[0])
     for _, fmt in timed:
         yield fmt
@@ -461,9 +630,11 @@ def _filter_by_agent(
     spawn_list: list[Spawn],
     agent: str | None,
     agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
 ) -> list[Spawn]:
     if not agent:
         return spawn_list
+    _prime_agents(spawn_list, agent_cache, model_cache)
     return [
         s
         for s in spawn_list
@@ -475,13 +646,14 @@ def _fetch_recent_spawns(
     since_minutes: int,
     agent: str | None,
     agent_cache: dict[str, str],
+    model_cache: dict[str, str | None],
 ) -> list[Spawn]:
     since_iso = (datetime.now(UTC) - timedelta(minutes=since_minutes)).isoformat()
     active = spawn.fetch(status=SpawnStatus.ACTIVE)
     recent = spawn.fetch(since=since_iso)
     seen = {s.id for s in active}
     all_spawns = active + [s for s in recent if s.id not in seen]
-    return _filter_by_agent(all_spawns, agent, agent_cache)
+    return _filter_by_agent(all_spawns, agent, agent_cache, model_cache)
 
 
 def tail_spawns(
@@ -492,12 +664,13 @@ def tail_spawns(
     watch: bool = False,
 ):
     agent_cache: dict[str, str] = {}
+    model_cache: dict[str, str | None] = {}
     effective_since = since_minutes if since_minutes is not None else 10
-    recent_spawns = _fetch_recent_spawns(effective_since, agent, agent_cache)
+    recent_spawns = _fetch_recent_spawns(effective_since, agent, agent_cache, model_cache)
 
     yield f"{ansi.mention('swarm')} {ansi.bold('brr')}"
     if recent_spawns:
-        for line in _render_history_chronological(recent_spawns, agent_cache):
+        for line in _render_history_chronological(recent_spawns, agent_cache, model_cache):
             yield line
 
     if not watch:
@@ -508,7 +681,8 @@ def tail_spawns(
 
     def _sync() -> tuple[list[tuple[str, float | None]], list[tuple[str, str | None]]]:
         current = spawn.fetch(status=SpawnStatus.ACTIVE)
-        current = _filter_by_agent(current, agent, agent_cache)
+        current = _filter_by_agent(current, agent, agent_cache, model_cache)
+        _prime_agents(current, agent_cache, model_cache)
         spawn_map = {s.id: s for s in current}
         active_ids = set(spawn_map.keys())
         current_ids = set(streams.keys())
@@ -518,16 +692,14 @@ def tail_spawns(
             if s.id in current_ids or s.id in seen_error_ids:
                 continue
             if s.status == SpawnStatus.DONE and s.error:
-                ag = agents_mod.get(s.agent_id)
-                handle = ag.handle if ag else s.agent_id[:8]
+                handle = _resolve_handle(s.agent_id, agent_cache)
                 removed.append((handle, s.error))
                 seen_error_ids.add(s.id)
                 continue
-            path = spawn_path(s, agent_cache)
+            path = spawn_path(s, agent_cache, model_cache)
             if path:
-                ag = agents_mod.get(s.agent_id)
-                handle = ag.handle if ag else s.agent_id[:8]
-                model = ag.model if ag else None
+                handle = _resolve_handle(s.agent_id, agent_cache)
+                model = _resolve_model(s.agent_id, model_cache)
                 u = spawn.usage(s)
                 pct = u.get("percentage") if u else None
                 stat = path.stat()
@@ -536,7 +708,7 @@ def tail_spawns(
                     and (time.time() - stat.st_mtime) > _STALE_THRESHOLD_SECONDS
                 ):
                     continue
-                pos = max(0, stat.st_size - 8192)
+                pos = _line_start(path, max(0, stat.st_size - 8192))
                 streams[s.id] = StreamState(
                     s.id, handle, path, pos, ctx_pct=pct, model=model, shown_starting=True
                 )
@@ -562,14 +734,32 @@ def tail_spawns(
     for handle, pct in added:
         wake = random.choice(trace.WAKE_PHRASES)  # noqa: S311
         yield f"{format_nameplate(handle, pct)} {ansi.white(wake)}"
-    last_sync = time.time()
+    last_sync = last_check = time.time()
+    last_signature = _watch_signature()
 
     try:
         while True:
             for t in list(streams.values()):
+                if t.skip_ticks:
+                    t.skip_ticks -= 1
+                    continue
+                position = t.position
                 for _, line in read_stream(t, verbose=verbose, identities=seen_identities):
                     yield line
-            if time.time() - last_sync > 1.0:
+                if t.position == position:
+                    t.idle_ticks += 1
+                    t.skip_ticks = min(t.idle_ticks, _IDLE_SKIP_MAX_TICKS)
+                else:
+                    t.idle_ticks = 0
+            now = time.time()
+            if now - last_check > _SYNC_CHECK_SECONDS:
+                last_check = now
+                signature = _watch_signature()
+                due = signature != last_signature or now - last_sync > _SYNC_FALLBACK_SECONDS
+                last_signature = signature
+            else:
+                due = False
+            if due:
                 added, removed = _sync()
                 for handle, pct in added:
                     if handle not in seen_identities:
@@ -601,6 +791,7 @@ def replay_date(
             return [line.rstrip() for line in f]
 
     agent_cache: dict[str, str] = {}
+    model_cache: dict[str, str | None] = {}
     start = datetime.combine(target_date, datetime.min.time()).isoformat()
     end = datetime.combine(target_date, datetime.max.time()).isoformat()
 
@@ -608,6 +799,7 @@ def replay_date(
     day_spawns = [s for s in all_spawns if s.created_at and s.created_at <= end]
 
     if agent:
+        _prime_agents(day_spawns, agent_cache, model_cache)
         day_spawns = [
             s
             for s in day_spawns
@@ -617,9 +809,10 @@ def replay_date(
     if not day_spawns:
         return []
 
+    _prime_agents(day_spawns, agent_cache, model_cache)
     timed: list[tuple[str, str]] = []
     for s in day_spawns:
-        timed.extend(parse_spawn_file(s, agent_cache))
+        timed.extend(parse_spawn_file(s, agent_cache, model_cache))
 
     timed.sort(key=lambda t: t[0])
     return [fmt for _, fmt in timed]
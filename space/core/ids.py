@@ -22,8 +22,8 @@ def generate(table: str, conn: sqlite3.Connection | None = None) -> str:
     def _gen(c: sqlite3.Connection) -> str:
         for _ in range(10):
             candidate = uuid4().hex[:8]
-            query = f"SELECT 1 FROM {table} WHERE id LIKE ? LIMIT 1"  # noqa: S608
-            clash = c.execute(query, (f"{candidate}%",)).fetchone()
+            query = f"SELECT 1 FROM {table} WHERE id >= ? AND id < ? LIMIT 1"  # noqa: S608
+            clash = c.execute(query, store.prefix_range(candidate)).fetchone()
             if not clash:
                 return candidate
         raise RuntimeError(f"ID generation exhausted for {table}")
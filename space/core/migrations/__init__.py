@@ -1,5 +1,7 @@
 import sqlite3
 
+from space.lib.store.sqlite import placeholders
+
 
 def migration_003_add_pr_events(conn: sqlite3.Connection) -> None:
     conn.execute("""
@@ -25,19 +27,170 @@ def migration_003_add_pr_events(conn: sqlite3.Connection) -> None:
 
 
 def migration_018_health_suppressions(conn: sqlite3.Connection) -> None:
-    cursor = conn.execute("PRAGMA table_info(health_metrics)")
-    columns = {row[1] for row in cursor.fetchall()}
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(health_metrics)")}
     if "suppressions" not in columns:
         conn.execute(
             "ALTER TABLE health_metrics ADD COLUMN suppressions INTEGER NOT NULL DEFAULT 0"
         )
 
 
+def migration_019_live_id_indexes(conn: sqlite3.Connection) -> None:
+    for table in ("insights", "decisions", "tasks"):
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_live ON {table}(id) WHERE deleted_at IS NULL"
+        )
+
+
+def migration_020_activity_primitive_id_index(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_activity_primitive_id "
+        "ON activity(primitive_id, created_at DESC)"
+    )
+
+
+def migration_021_activity_created_at_norm(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(activity)")}
+    if "created_at_norm" not in columns:
+        conn.execute(
+            "ALTER TABLE activity ADD COLUMN created_at_norm TEXT "
+            f"GENERATED ALWAYS AS ({_CREATED_AT_NORM}) VIRTUAL"
+        )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_activity_created_norm ON activity(created_at_norm)"
+    )
+
+
+def migration_022_activity_agent_created_index(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_activity_agent_created "
+        "ON activity(agent_id, created_at DESC)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_activity_agent")
+
+
+def migration_023_insights_decision_live_index(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_insights_decision_live "
+        "ON insights(decision_id, created_at) WHERE deleted_at IS NULL"
+    )
+
+
+_DECISION_STATE_INDEXES = (
+    (
+        "idx_decisions_proposed_live",
+        "project_id, created_at DESC",
+        "committed_at IS NULL AND rejected_at IS NULL",
+    ),
+    (
+        "idx_decisions_committed_live",
+        "project_id, created_at DESC",
+        "committed_at IS NOT NULL AND actioned_at IS NULL AND rejected_at IS NULL",
+    ),
+    (
+        "idx_decisions_actioned_live",
+        "project_id, created_at DESC",
+        "actioned_at IS NOT NULL AND rejected_at IS NULL",
+    ),
+    ("idx_decisions_rejected_live", "project_id, rejected_at DESC", "rejected_at IS NOT NULL"),
+)
+
+
+def migration_024_decision_state_indexes(conn: sqlite3.Connection) -> None:
+    for name, columns, state in _DECISION_STATE_INDEXES:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON decisions({columns}) "
+            f"WHERE deleted_at IS NULL AND archived_at IS NULL AND {state}"
+        )
+
+
+def migration_025_decision_rejection_reason(conn: sqlite3.Connection) -> None:
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(decisions)")}
+    if "rejection_reason" in columns:
+        return
+    conn.execute("ALTER TABLE decisions ADD COLUMN rejection_reason TEXT")
+    conn.execute("""
+        UPDATE decisions SET rejection_reason = (
+            SELECT CASE WHEN r.content LIKE 'Rejected: %' THEN substr(r.content, 11) ELSE r.content END
+            FROM replies r
+            WHERE r.parent_type = 'decision' AND r.parent_id = decisions.id
+              AND r.content LIKE 'Rejected:%' AND r.deleted_at IS NULL
+            ORDER BY r.created_at
+            LIMIT 1
+        )
+        WHERE rejected_at IS NOT NULL
+    """)
+
+
+def migration_026_projects_github_login_type(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_projects_github_login_type "
+        "ON projects(github_login, type)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_projects_github_login")
+
+
+_MIGRATION_APPLIED_SQL = "SELECT 1 FROM _migrations WHERE name = ?"
+_INSERT_FOLDED_SQL = "INSERT OR IGNORE INTO _migrations (name) VALUES (?)"
+
+
 def migration_012_flatten_repair(conn: sqlite3.Connection) -> None:
-    _add_summaries_table(conn)
-    _widen_activity_check(conn)
-    _ensure_triggers(conn)
-    _mark_folded_migrations(conn)
+    if conn.execute(_MIGRATION_APPLIED_SQL, ("012_flatten_repair",)).fetchone():
+        return
+    owns_tx = not conn.in_transaction
+    if owns_tx:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        _add_summaries_table(conn)
+        _widen_activity_check(conn)
+        _ensure_triggers(conn)
+        _mark_folded_migrations(conn)
+    except Exception:
+        if owns_tx:
+            conn.execute("ROLLBACK")
+        raise
+    if owns_tx:
+        conn.execute("COMMIT")
+
+
+_SUMMARIES_DDL = (
+    """CREATE TABLE summaries (
+        id TEXT PRIMARY KEY,
+        agent_id TEXT NOT NULL REFERENCES agents(id) ON DELETE RESTRICT,
+        project_id TEXT REFERENCES projects(id) ON DELETE RESTRICT,
+        spawn_id TEXT REFERENCES spawns(id) ON DELETE SET NULL,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        archived_at TEXT,
+        deleted_at TEXT
+    )""",
+    "CREATE INDEX idx_summaries_agent ON summaries(agent_id)",
+    "CREATE INDEX idx_summaries_project ON summaries(project_id)",
+    "CREATE INDEX idx_summaries_spawn ON summaries(spawn_id)",
+    "CREATE INDEX idx_summaries_created ON summaries(created_at DESC)",
+    "CREATE INDEX idx_summaries_archived ON summaries(archived_at)",
+    """CREATE VIRTUAL TABLE summaries_fts USING fts5(
+        content, content='summaries', content_rowid='rowid'
+    )""",
+    """CREATE TRIGGER summaries_fts_ai AFTER INSERT ON summaries BEGIN
+        INSERT INTO summaries_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+    """CREATE TRIGGER summaries_fts_ad AFTER DELETE ON summaries
+    WHEN old.deleted_at IS NULL BEGIN
+        INSERT INTO summaries_fts(summaries_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+    END""",
+    """CREATE TRIGGER summaries_fts_au AFTER UPDATE ON summaries
+    WHEN new.deleted_at IS NULL BEGIN
+        INSERT INTO summaries_fts(summaries_fts, rowid, content)
+        SELECT 'delete', old.rowid, old.content WHERE old.deleted_at IS NULL;
+        INSERT INTO summaries_fts(rowid, content) VALUES (new.rowid, new.content);
+    END""",
+    """CREATE TRIGGER summaries_fts_au_delete AFTER UPDATE ON summaries
+    WHEN new.deleted_at IS NOT NULL AND old.deleted_at IS NULL BEGIN
+        INSERT INTO summaries_fts(summaries_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+    END""",
+)
 
 
 def _add_summaries_table(conn: sqlite3.Connection) -> None:
@@ -47,41 +200,35 @@ def _add_summaries_table(conn: sqlite3.Connection) -> None:
     if exists:
         return
 
-    conn.executescript("""
-        CREATE TABLE summaries (
-            id TEXT PRIMARY KEY,
-            agent_id TEXT NOT NULL REFERENCES agents(id) ON DELETE RESTRICT,
-            project_id TEXT REFERENCES projects(id) ON DELETE RESTRICT,
-            spawn_id TEXT REFERENCES spawns(id) ON DELETE SET NULL,
-            content TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            archived_at TEXT,
-            deleted_at TEXT
-        );
-        CREATE INDEX idx_summaries_agent ON summaries(agent_id);
-        CREATE INDEX idx_summaries_project ON summaries(project_id);
-        CREATE INDEX idx_summaries_spawn ON summaries(spawn_id);
-        CREATE INDEX idx_summaries_created ON summaries(created_at DESC);
-        CREATE INDEX idx_summaries_archived ON summaries(archived_at);
-
-        CREATE VIRTUAL TABLE summaries_fts USING fts5(id UNINDEXED, content);
-
-        CREATE TRIGGER summaries_fts_ai AFTER INSERT ON summaries BEGIN
-            INSERT INTO summaries_fts(id, content) VALUES (new.id, new.content);
-        END;
-        CREATE TRIGGER summaries_fts_ad AFTER DELETE ON summaries BEGIN
-            DELETE FROM summaries_fts WHERE id = old.id;
-        END;
-        CREATE TRIGGER summaries_fts_au AFTER UPDATE ON summaries
-        WHEN new.deleted_at IS NULL BEGIN
-            DELETE FROM summaries_fts WHERE id = old.id;
-            INSERT INTO summaries_fts(id, content) VALUES (new.id, new.content);
-        END;
-        CREATE TRIGGER summaries_fts_au_delete AFTER UPDATE ON summaries
-        WHEN new.deleted_at IS NOT NULL AND old.deleted_at IS NULL BEGIN
-            DELETE FROM summaries_fts WHERE id = old.id;
-        END;
-    """)
+    for sql in _SUMMARIES_DDL:
+        conn.execute(sql)
+
+
+_CREATED_AT_NORM = "replace(replace(replace(created_at, 'T', ' '), 'Z', ''), '+00:00', '')"
+
+_ACTIVITY_INDEXES = (
+    ("idx_activity_agent_created", "agent_id, created_at DESC"),
+    ("idx_activity_primitive", "primitive, primitive_id"),
+    ("idx_activity_primitive_id", "primitive_id, created_at DESC"),
+    ("idx_activity_created", "created_at"),
+    ("idx_activity_created_norm", "created_at_norm"),
+)
+
+
+_LEGACY_TRIGGERS = (
+    "spawn_started",
+    "spawn_completed",
+    "spawn_failed",
+    "decision_created",
+    "decision_archived",
+    "insight_created",
+    "insight_archived",
+    "insight_linked",
+    "insight_resolved",
+    "task_created",
+    "task_status_change",
+    "reply_created",
+)
 
 
 def _widen_activity_check(conn: sqlite3.Connection) -> None:
@@ -91,22 +238,12 @@ def _widen_activity_check(conn: sqlite3.Connection) -> None:
     if not schema or "'summary'" in schema[0]:
         return
 
-    conn.execute("DROP TRIGGER IF EXISTS spawn_started")
-    conn.execute("DROP TRIGGER IF EXISTS spawn_completed")
-    conn.execute("DROP TRIGGER IF EXISTS spawn_failed")
-    conn.execute("DROP TRIGGER IF EXISTS decision_created")
-    conn.execute("DROP TRIGGER IF EXISTS decision_archived")
-    conn.execute("DROP TRIGGER IF EXISTS insight_created")
-    conn.execute("DROP TRIGGER IF EXISTS insight_archived")
-    conn.execute("DROP TRIGGER IF EXISTS insight_linked")
-    conn.execute("DROP TRIGGER IF EXISTS insight_resolved")
-    conn.execute("DROP TRIGGER IF EXISTS task_created")
-    conn.execute("DROP TRIGGER IF EXISTS task_status_change")
-    conn.execute("DROP TRIGGER IF EXISTS reply_created")
+    for name in _LEGACY_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
 
     max_id = conn.execute("SELECT MAX(id) FROM activity").fetchone()[0] or 0
 
-    conn.execute("""
+    conn.execute(f"""
         CREATE TABLE activity_new (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             agent_id TEXT NOT NULL,
@@ -117,7 +254,8 @@ def _widen_activity_check(conn: sqlite3.Connection) -> None:
             field TEXT,
             before TEXT,
             after TEXT,
-            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+            created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+            created_at_norm TEXT GENERATED ALWAYS AS ({_CREATED_AT_NORM}) VIRTUAL
         )
     """)
 
@@ -129,9 +267,9 @@ def _widen_activity_check(conn: sqlite3.Connection) -> None:
 
     conn.execute("DROP TABLE activity")
     conn.execute("ALTER TABLE activity_new RENAME TO activity")
-    conn.execute("CREATE INDEX idx_activity_agent ON activity(agent_id)")
-    conn.execute("CREATE INDEX idx_activity_primitive ON activity(primitive, primitive_id)")
-    conn.execute("CREATE INDEX idx_activity_created ON activity(created_at)")
+    for name, columns in _ACTIVITY_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.execute(f"CREATE INDEX {name} ON activity({columns})")
 
     conn.execute(
         "UPDATE sqlite_sequence SET seq = ? WHERE name = 'activity'",
@@ -146,13 +284,13 @@ _TRIGGERS = [
     END""",
     """CREATE TRIGGER spawn_completed AFTER UPDATE OF status ON spawns
     WHEN OLD.status = 'active' AND NEW.status = 'done' AND NEW.error IS NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-        VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'completed', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+        VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'completed');
     END""",
     """CREATE TRIGGER spawn_failed AFTER UPDATE OF status ON spawns
     WHEN OLD.status = 'active' AND NEW.status = 'done' AND NEW.error IS NOT NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after, created_at)
-        VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'failed', 'error', NEW.error, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after)
+        VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'failed', 'error', NEW.error);
     END""",
     """CREATE TRIGGER decision_created AFTER INSERT ON decisions BEGIN
         INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
@@ -160,8 +298,8 @@ _TRIGGERS = [
     END""",
     """CREATE TRIGGER decision_archived AFTER UPDATE OF archived_at ON decisions
     WHEN OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-        VALUES (NEW.agent_id, NEW.spawn_id, 'decision', NEW.id, 'archived', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+        VALUES (NEW.agent_id, NEW.spawn_id, 'decision', NEW.id, 'archived');
     END""",
     """CREATE TRIGGER insight_created AFTER INSERT ON insights BEGIN
         INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
@@ -169,18 +307,18 @@ _TRIGGERS = [
     END""",
     """CREATE TRIGGER insight_archived AFTER UPDATE OF archived_at ON insights
     WHEN OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'archived', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'archived');
     END""",
     """CREATE TRIGGER insight_linked AFTER UPDATE OF decision_id ON insights
     WHEN OLD.decision_id IS NULL AND NEW.decision_id IS NOT NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after, created_at)
-        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'linked', 'decision_id', NEW.decision_id, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after)
+        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'linked', 'decision_id', NEW.decision_id);
     END""",
     """CREATE TRIGGER insight_resolved AFTER UPDATE OF open ON insights
     WHEN OLD.open = 1 AND NEW.open = 0 BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'resolved', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+        VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'resolved');
     END""",
     """CREATE TRIGGER task_created AFTER INSERT ON tasks BEGIN
         INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
@@ -206,20 +344,26 @@ _TRIGGERS = [
     END""",
     """CREATE TRIGGER summary_archived AFTER UPDATE OF archived_at ON summaries
     WHEN OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL BEGIN
-        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-        VALUES (NEW.agent_id, NEW.spawn_id, 'summary', NEW.id, 'archived', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+        INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+        VALUES (NEW.agent_id, NEW.spawn_id, 'summary', NEW.id, 'archived');
     END""",
 ]
 
 
+_NAMED_TRIGGERS = tuple(
+    (sql.split("CREATE TRIGGER ", 1)[1].split(" ", 1)[0], sql) for sql in _TRIGGERS
+)
+_TRIGGER_NAMES = tuple(name for name, _ in _NAMED_TRIGGERS)
+_EXISTING_TRIGGERS_SQL = (
+    "SELECT name FROM sqlite_master WHERE type='trigger' "
+    f"AND name IN ({placeholders(_TRIGGER_NAMES)})"  # noqa: S608
+)
+
+
 def _ensure_triggers(conn: sqlite3.Connection) -> None:
-    for sql in _TRIGGERS:
-        name = sql.split("CREATE TRIGGER ")[1].split(" ")[0]
-        exists = conn.execute(
-            "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name=?",
-            (name,),
-        ).fetchone()
-        if not exists:
+    existing = {row[0] for row in conn.execute(_EXISTING_TRIGGERS_SQL, _TRIGGER_NAMES)}
+    for name, sql in _NAMED_TRIGGERS:
+        if name not in existing:
             conn.execute(sql)
 
 
@@ -238,6 +382,6 @@ def _mark_folded_migrations(conn: sqlite3.Connection) -> None:
         "010_health_metrics",
         "010_summaries",
         "011_health_metrics",
+        "012_flatten_repair",
     ]
-    for name in folded:
-        conn.execute("INSERT OR IGNORE INTO _migrations (name) VALUES (?)", (name,))
+    conn.executemany(_INSERT_FOLDED_SQL, [(name,) for name in folded])
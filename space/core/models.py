@@ -18,7 +18,7 @@ from space.core.types import (
 # AGENTS
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     id: AgentId
     handle: str
@@ -33,7 +33,7 @@ class Agent:
     merged_into: AgentId | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: ProjectId
     name: str
@@ -49,7 +49,7 @@ class Project:
     archived_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     id: str
     owner_id: AgentId
@@ -72,7 +72,7 @@ class SpawnMode(str, Enum):
     DIRECTED = "directed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Spawn:
     id: SpawnId
     agent_id: AgentId
@@ -100,7 +100,7 @@ class DecisionStatus(str, Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     id: DecisionId
     project_id: ProjectId
@@ -117,6 +117,7 @@ class Decision:
     committed_at: str | None = None
     actioned_at: str | None = None
     rejected_at: str | None = None
+    rejection_reason: str | None = None
     archived_at: str | None = None
     deleted_at: str | None = None
 
@@ -124,7 +125,7 @@ class Decision:
 # INSIGHTS
 
 
-@dataclass
+@dataclass(slots=True)
 class Insight:
     id: InsightId
     project_id: ProjectId
@@ -153,7 +154,7 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: TaskId
     project_id: ProjectId
@@ -173,7 +174,7 @@ class Task:
 # REPLIES
 
 
-@dataclass
+@dataclass(slots=True)
 class Reply:
     id: ReplyId
     parent_type: ArtifactType
@@ -203,7 +204,7 @@ class EmailStatus(str, Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Email:
     id: str
     resend_id: str | None
@@ -222,7 +223,7 @@ class Email:
 # HEALTH
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthMetric:
     id: HealthMetricId
     score: int
@@ -240,7 +241,7 @@ class HealthMetric:
 # TELEMETRY
 
 
-@dataclass
+@dataclass(slots=True)
 class CliInvocation:
     id: CliInvocationId
     ts: str
@@ -42,7 +42,7 @@ CREATE TABLE projects (
     archived_at TEXT
 );
 
-CREATE INDEX idx_projects_github_login ON projects(github_login);
+CREATE INDEX idx_projects_github_login_type ON projects(github_login, type);
 CREATE INDEX idx_projects_type ON projects(type);
 
 
@@ -107,6 +107,7 @@ CREATE TABLE decisions (
     committed_at TEXT,
     actioned_at TEXT,
     rejected_at TEXT,
+    rejection_reason TEXT,
     archived_at TEXT,
     deleted_at TEXT
 );
@@ -118,6 +119,16 @@ CREATE INDEX idx_decisions_created ON decisions(created_at DESC);
 CREATE INDEX idx_decisions_committed ON decisions(committed_at);
 CREATE INDEX idx_decisions_archived ON decisions(archived_at);
 CREATE INDEX idx_decisions_deleted ON decisions(deleted_at);
+CREATE INDEX idx_decisions_live ON decisions(id) WHERE deleted_at IS NULL;
+CREATE INDEX idx_decisions_proposed_live ON decisions(project_id, created_at DESC)
+    WHERE deleted_at IS NULL AND archived_at IS NULL AND committed_at IS NULL AND rejected_at IS NULL;
+CREATE INDEX idx_decisions_committed_live ON decisions(project_id, created_at DESC)
+    WHERE deleted_at IS NULL AND archived_at IS NULL AND committed_at IS NOT NULL
+      AND actioned_at IS NULL AND rejected_at IS NULL;
+CREATE INDEX idx_decisions_actioned_live ON decisions(project_id, created_at DESC)
+    WHERE deleted_at IS NULL AND archived_at IS NULL AND actioned_at IS NOT NULL AND rejected_at IS NULL;
+CREATE INDEX idx_decisions_rejected_live ON decisions(project_id, rejected_at DESC)
+    WHERE deleted_at IS NULL AND archived_at IS NULL AND rejected_at IS NOT NULL;
 
 
 -- INSIGHTS
@@ -145,10 +156,12 @@ CREATE INDEX idx_insights_project ON insights(project_id);
 CREATE INDEX idx_insights_agent ON insights(agent_id);
 CREATE INDEX idx_insights_spawn ON insights(spawn_id);
 CREATE INDEX idx_insights_decision ON insights(decision_id);
+CREATE INDEX idx_insights_decision_live ON insights(decision_id, created_at) WHERE deleted_at IS NULL;
 CREATE INDEX idx_insights_domain ON insights(domain);
 CREATE INDEX idx_insights_created ON insights(created_at);
 CREATE INDEX idx_insights_open ON insights(open) WHERE open = 1;
 CREATE INDEX idx_insights_provenance ON insights(provenance) WHERE provenance IS NOT NULL;
+CREATE INDEX idx_insights_live ON insights(id) WHERE deleted_at IS NULL;
 
 
 -- TASKS
@@ -177,6 +190,7 @@ CREATE INDEX idx_tasks_assignee ON tasks(assignee_id);
 CREATE INDEX idx_tasks_spawn ON tasks(spawn_id);
 CREATE INDEX idx_tasks_status ON tasks(status);
 CREATE INDEX idx_tasks_created ON tasks(created_at);
+CREATE INDEX idx_tasks_live ON tasks(id) WHERE deleted_at IS NULL;
 
 
 -- REPLIES
@@ -278,12 +292,17 @@ CREATE TABLE activity (
     field TEXT,
     before TEXT,
     after TEXT,
-    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
+    created_at_norm TEXT GENERATED ALWAYS AS (
+        replace(replace(replace(created_at, 'T', ' '), 'Z', ''), '+00:00', '')
+    ) VIRTUAL
 );
 
-CREATE INDEX idx_activity_agent ON activity(agent_id);
+CREATE INDEX idx_activity_agent_created ON activity(agent_id, created_at DESC);
 CREATE INDEX idx_activity_primitive ON activity(primitive, primitive_id);
+CREATE INDEX idx_activity_primitive_id ON activity(primitive_id, created_at DESC);
 CREATE INDEX idx_activity_created ON activity(created_at);
+CREATE INDEX idx_activity_created_norm ON activity(created_at_norm);
 
 
 -- FTS: SPAWNS
@@ -396,14 +415,14 @@ END;
 
 CREATE TRIGGER spawn_completed AFTER UPDATE OF status ON spawns
 WHEN OLD.status = 'active' AND NEW.status = 'done' AND NEW.error IS NULL BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-    VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'completed', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+    VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'completed');
 END;
 
 CREATE TRIGGER spawn_failed AFTER UPDATE OF status ON spawns
 WHEN OLD.status = 'active' AND NEW.status = 'done' AND NEW.error IS NOT NULL BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after, created_at)
-    VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'failed', 'error', NEW.error, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after)
+    VALUES (NEW.agent_id, NEW.id, 'spawn', NEW.id, 'failed', 'error', NEW.error);
 END;
 
 
@@ -417,8 +436,8 @@ END;
 
 CREATE TRIGGER decision_archived AFTER UPDATE OF archived_at ON decisions
 WHEN OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-    VALUES (NEW.agent_id, NEW.spawn_id, 'decision', NEW.id, 'archived', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+    VALUES (NEW.agent_id, NEW.spawn_id, 'decision', NEW.id, 'archived');
 END;
 
 
@@ -432,20 +451,20 @@ END;
 
 CREATE TRIGGER insight_archived AFTER UPDATE OF archived_at ON insights
 WHEN OLD.archived_at IS NULL AND NEW.archived_at IS NOT NULL BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'archived', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'archived');
 END;
 
 CREATE TRIGGER insight_linked AFTER UPDATE OF decision_id ON insights
 WHEN OLD.decision_id IS NULL AND NEW.decision_id IS NOT NULL BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after, created_at)
-    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'linked', 'decision_id', NEW.decision_id, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, field, after)
+    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'linked', 'decision_id', NEW.decision_id);
 END;
 
 CREATE TRIGGER insight_resolved AFTER UPDATE OF open ON insights
 WHEN OLD.open = 1 AND NEW.open = 0 BEGIN
-    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action, created_at)
-    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'resolved', strftime('%Y-%m-%dT%H:%M:%fZ', 'now'));
+    INSERT INTO activity (agent_id, spawn_id, primitive, primitive_id, action)
+    VALUES (NEW.agent_id, NEW.spawn_id, 'insight', NEW.id, 'resolved');
 END;
 
 
@@ -12,41 +12,14 @@ Unset = Literal[_Unset.UNSET]
 
 AgentType = Literal["human", "ai", "system"]
 
-
-class AgentId(str):
-    pass
-
-
-class SpawnId(str):
-    pass
-
-
-class TaskId(str):
-    pass
-
-
-class InsightId(str):
-    pass
-
-
-class ProjectId(str):
-    pass
-
-
-class DecisionId(str):
-    pass
-
-
-class ReplyId(str):
-    pass
-
-
-class HealthMetricId(str):
-    pass
-
-
-class CliInvocationId(int):
-    pass
-
+AgentId = str
+SpawnId = str
+TaskId = str
+InsightId = str
+ProjectId = str
+DecisionId = str
+ReplyId = str
+HealthMetricId = str
+CliInvocationId = int
 
 ArtifactType = Literal["insight", "decision", "task"]
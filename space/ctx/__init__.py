@@ -6,13 +6,10 @@ from space.core.models import Agent, Spawn, SpawnStatus
 from space.core.types import AgentId, SpawnId
 from space.ctx.prompt import resume
 from space.ctx.prompt import wake as _wake
-from space.ctx.system import build
+from space.ctx.system import IDENTITIES_DIR, build, identity_path
 from space.lib import paths, providers
 from space.lib.providers import models
 
-_CTX_DIR = Path(__file__).parent
-IDENTITIES_DIR = _CTX_DIR / "identities"
-
 PROVIDER_MAP = {
     "claude": "CLAUDE.md",
     "gemini": "GEMINI.md",
@@ -30,14 +27,6 @@ __all__ = [
 ]
 
 
-def identity_path(name: str) -> Path:
-    if name.startswith("/") or ".." in name or not name:
-        raise ValidationError(f"Invalid identity name: {name}")
-    if name.endswith(".md"):
-        return IDENTITIES_DIR / name
-    return IDENTITIES_DIR / f"{name}.md"
-
-
 def inject(spawn: Spawn, agent: Agent, cwd: Path | None = None) -> Path:
     target_dir = paths.identity_dir(agent.handle)
     target_dir.mkdir(parents=True, exist_ok=True)
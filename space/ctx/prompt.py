@@ -1,5 +1,6 @@
 
-from datetime import UTC, datetime
+import calendar
+import time
 
 from space import agents
 from space.agents import spawn
@@ -9,6 +10,7 @@ from space.lib import store
 from space.lib.display import format as format_mod
 
 _CACHE_TTL = 300
+_routines_cache: tuple[float, str] | None = None
 
 
 def wake(spawn: Spawn, agent: Agent | None = None, skills: list[str] | None = None) -> str:
@@ -77,21 +79,33 @@ def _recent_summaries(agent: Agent, current_spawn: Spawn) -> list[str]:
         status=SpawnStatus.DONE,
         limit=3,
     )
-    return [_format_summary(s) for s in prior if s.summary and s.id != current_spawn.id]
+    now = time.time()
+    return [_format_summary(s, now) for s in prior if s.summary and s.id != current_spawn.id]
 
 
-def _format_summary(s) -> str:
-    ts = _ago_str(getattr(s, "created_at", None) or getattr(s, "last_active_at", None))
+def _format_summary(s, now: float) -> str:
+    ts = _ago_str(getattr(s, "created_at", None) or getattr(s, "last_active_at", None), now)
     spawn_ref = store.ref("spawns", s.id)
     return f"{spawn_ref} ({ts}): {s.summary}"
 
 
-def _ago_str(timestamp: str | None) -> str:
+def _ago_str(timestamp: str | None, now: float) -> str:
     if not timestamp:
         return "?"
-    last = datetime.fromisoformat(timestamp)
-    delta = datetime.now(UTC) - last
-    hours = int(delta.total_seconds() // 3600)
+    last = calendar.timegm(
+        (
+            int(timestamp[0:4]),
+            int(timestamp[5:7]),
+            int(timestamp[8:10]),
+            int(timestamp[11:13]),
+            int(timestamp[14:16]),
+            int(timestamp[17:19]),
+            0,
+            0,
+            0,
+        )
+    )
+    hours = int((now - last) // 3600)
     if hours < 1:
         return "<1h ago"
     if hours < 24:
@@ -102,7 +116,7 @@ def _ago_str(timestamp: str | None) -> str:
 def _projects_block(spawn: Spawn) -> str:
     from space.lib import config  # noqa: PLC0415
 
-    all_projects = projects.fetch()
+    all_projects = projects.fetch_with_stats()
     if not all_projects:
         return ""
 
@@ -110,33 +124,30 @@ def _projects_block(spawn: Spawn) -> str:
     focus_project = cfg.swarm.project if cfg.swarm.enabled else None
 
     if focus_project:
-        all_projects = [p for p in all_projects if p.name == focus_project]
+        all_projects = [row for row in all_projects if row[0].name == focus_project]
         if not all_projects:
             return ""
 
-    project_ids = [p.id for p in all_projects]
-    last_active_map = projects.batch_last_active(project_ids)
-    artifact_counts = projects.batch_artifact_counts(project_ids)
-
-    sorted_projects = sorted(
-        all_projects,
-        key=lambda p: (last_active_map.get(p.id) or p.created_at or "", p.name),
-        reverse=True,
+    body = "\n".join(
+        f"{p.name:<15} {count:>4} {format_mod.ago(last_active) if last_active else '·':>3}"
+        + (f"  [{','.join(p.tags)}]" if p.tags else "")
+        + (f"  {p.repo_path}" if p.repo_path else "")
+        for p, last_active, count in all_projects
     )
+    return f"<projects>\n{body}\n</projects>"
 
-    lines = []
-    for p in sorted_projects:
-        count = artifact_counts.get(p.id, 0)
-        last_active = last_active_map.get(p.id)
-        activity = format_mod.ago(last_active) if last_active else "·"
-        tags_str = f"  [{','.join(p.tags)}]" if p.tags else ""
-        path_str = f"  {p.repo_path}" if p.repo_path else ""
-        lines.append(f"{p.name:<15} {count:>4} {activity:>3}{tags_str}{path_str}")
 
-    return f"<projects>\n{chr(10).join(lines)}\n</projects>"
+def _routines_block() -> str:
+    global _routines_cache
+    now = time.monotonic()
+    if _routines_cache and now - _routines_cache[0] < _CACHE_TTL:
+        return _routines_cache[1]
+    block = _render_routines()
+    _routines_cache = (now, block)
+    return block
 
 
-def _routines_block() -> str:
+def _render_routines() -> str:
     all_routines = insights.fetch(domain="routine", limit=50)
     routines = [r for r in all_routines if r.open]
     if not routines:
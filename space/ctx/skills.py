@@ -1,5 +1,6 @@
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from space.core.errors import ValidationError
@@ -17,9 +18,15 @@ def list_skills() -> list[str]:
 
 def load(name: str) -> str:
     path = _SKILLS_DIR / f"{name}.md"
-    if not path.exists():
-        raise ValidationError(f"Unknown skill: {name}")
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        raise ValidationError(f"Unknown skill: {name}") from None
+    return _load_cached(path, mtime)
 
+
+@lru_cache(maxsize=64)
+def _load_cached(path: Path, mtime: float) -> str:
     content = path.read_text().strip()
     if match := _FRONTMATTER_RE.match(content):
         content = content[len(match.group(0)) :].strip()
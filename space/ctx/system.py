@@ -1,4 +1,6 @@
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from space.core.errors import ValidationError
@@ -7,25 +9,27 @@ from space.ledger import projects
 from space.stats.swarm import swarm_age
 
 _CTX_DIR = Path(__file__).parent
-_IDENTITIES_DIR = _CTX_DIR / "identities"
+IDENTITIES_DIR = _CTX_DIR / "identities"
 _SKILLS_DIR = _CTX_DIR / "skills"
-_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 _DESCRIPTION_RE = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
 
 
+@lru_cache(maxsize=16)
 def _read_ctx(name: str) -> str:
     return (_CTX_DIR / name).read_text().strip()
 
 
-def _identity_path(name: str) -> Path:
+def identity_path(name: str) -> Path:
     if name.startswith("/") or ".." in name or not name:
         raise ValidationError(f"Invalid identity name: {name}")
     if name.endswith(".md"):
-        return _IDENTITIES_DIR / name
-    return _IDENTITIES_DIR / f"{name}.md"
+        return IDENTITIES_DIR / name
+    return IDENTITIES_DIR / f"{name}.md"
 
 
 def build(agent: Agent, cwd: Path | None = None) -> str:
+    if os.environ.get("SPACE_ENV") == "dev":
+        _read_ctx.cache_clear()
     parts = []
 
     search_dir = cwd or Path.cwd()
@@ -40,8 +44,7 @@ def build(agent: Agent, cwd: Path | None = None) -> str:
         space_path = lattice / "SPACE.md"
 
     if agent.identity:
-        identity_path = _identity_path(agent.identity)
-        identity_content = identity_path.read_text().strip()
+        identity_content = identity_path(agent.identity).read_text().strip()
         parts.append(f"<identity>\n{identity_content}\n</identity>")
 
     welcome_text = _read_ctx("welcome.md")
@@ -77,13 +80,34 @@ def _constitution_for_cwd(cwd: Path | None) -> str:
 
 
 def _skill_index() -> str:
-    if not _SKILLS_DIR.exists():
+    try:
+        stamps = tuple(
+            (path.name, path.stat().st_mtime_ns) for path in sorted(_SKILLS_DIR.glob("*.md"))
+        )
+    except OSError:
         return ""
+    return _skill_index_cached(stamps)
+
+
+def _read_frontmatter(path: Path) -> str:
+    with path.open() as f:
+        if f.readline().strip() != "---":
+            return ""
+        lines = []
+        for line in f:
+            if line.strip() == "---":
+                break
+            lines.append(line)
+        return "".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _skill_index_cached(stamps: tuple[tuple[str, int], ...]) -> str:
     lines = []
-    for path in sorted(_SKILLS_DIR.glob("*.md")):
-        content = path.read_text()
+    for name, _ in stamps:
+        path = _SKILLS_DIR / name
         desc = path.stem
-        if (m := _FRONTMATTER_RE.match(content)) and (d := _DESCRIPTION_RE.search(m.group(1))):
+        if d := _DESCRIPTION_RE.search(_read_frontmatter(path)):
             desc = f"{path.stem}: {d.group(1).strip()}"
         lines.append(f"  {desc}")
     if not lines:
@@ -1,7 +1,6 @@
 from space.ledger import (
     activity,
     artifacts,
-    cli,
     decisions,
     delete,
     inbox,
@@ -9,15 +8,12 @@ from space.ledger import (
     ledger,
     projects,
     replies,
-    search,
-    status,
     tasks,
 )
 
 __all__ = [
     "activity",
     "artifacts",
-    "cli",
     "decisions",
     "delete",
     "inbox",
@@ -25,7 +21,5 @@ __all__ = [
     "ledger",
     "projects",
     "replies",
-    "search",
-    "status",
     "tasks",
 ]
@@ -1,7 +1,9 @@
 
 from dataclasses import dataclass
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, get_args
 
+from space.core.errors import ValidationError
 from space.lib import store
 
 Primitive = Literal["decision", "insight", "task", "reply", "spawn"]
@@ -19,6 +21,9 @@ Action = Literal[
     "failed",
 ]
 
+_PRIMITIVES: frozenset[str] = frozenset(get_args(Primitive))
+_ACTIONS: frozenset[str] = frozenset(get_args(Action))
+
 
 @dataclass
 class Activity:
@@ -34,6 +39,23 @@ class Activity:
     created_at: str
 
 
+_FILTER_CLAUSES = (
+    "primitive = ?",
+    "primitive_id = ?",
+    "agent_id = ?",
+    "action = ?",
+    "created_at_norm > ?",
+)
+
+
+@lru_cache(maxsize=32)
+def _fetch_sql(filters: tuple[bool, ...]) -> str:
+    where = "".join(
+        f" AND {clause}" for clause, on in zip(_FILTER_CLAUSES, filters, strict=True) if on
+    )
+    return f"SELECT * FROM activity WHERE 1=1{where} ORDER BY created_at DESC LIMIT ?"  # noqa: S608
+
+
 def fetch(
     primitive: Primitive | None = None,
     primitive_id: str | None = None,
@@ -42,40 +64,31 @@ def fetch(
     since: str | None = None,
     limit: int = 100,
 ) -> list[Activity]:
-    with store.ensure() as conn:
-        query = "SELECT * FROM activity WHERE 1=1"
-        params: list[str | int] = []
-
-        if primitive:
-            query += " AND primitive = ?"
-            params.append(primitive)
-
-        if primitive_id:
-            query += " AND primitive_id = ?"
-            params.append(primitive_id)
-
-        if agent_id:
-            query += " AND agent_id = ?"
-            params.append(agent_id)
-
-        if action:
-            query += " AND action = ?"
-            params.append(action)
-
-        if since:
-            query += " AND created_at > ?"
-            normalized = since.replace("T", " ").split("+")[0].split("Z")[0]
-            params.append(normalized)
-
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
+    if primitive and primitive not in _PRIMITIVES:
+        raise ValidationError(f"Unknown primitive: {primitive}")
+    if action and action not in _ACTIONS:
+        raise ValidationError(f"Unknown action: {action}")
+    if since:
+        since = since.replace("T", " ").split("+")[0].split("Z")[0]
+    values = (primitive, primitive_id, agent_id, action, since)
+    query = _fetch_sql(tuple(bool(v) for v in values))
+    params: list[str | int] = [v for v in values if v]
+    params.append(limit)
 
+    with store.ensure() as conn:
         rows = conn.execute(query, params).fetchall()
         return [store.from_row(row, Activity) for row in rows]
 
 
-def for_primitive(primitive_id: str) -> list[Activity]:
-    return fetch(primitive_id=primitive_id)
+_FOR_PRIMITIVE_SQL = (
+    "SELECT * FROM activity WHERE primitive_id = ? ORDER BY created_at DESC LIMIT ?"
+)
+
+
+def for_primitive(primitive_id: str, limit: int = 100) -> list[Activity]:
+    with store.ensure() as conn:
+        rows = conn.execute(_FOR_PRIMITIVE_SQL, (primitive_id, limit)).fetchall()
+    return store.from_rows(rows, Activity)
 
 
 def recent(limit: int = 50) -> list[Activity]:
@@ -0,0 +1,47 @@
+import argparse
+
+
+def _common() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-j", "--json", action="store_true", default=argparse.SUPPRESS, help="output as JSON"
+    )
+    return common
+
+
+def _action(
+    subs: argparse._SubParsersAction, name: str, help_text: str, common: argparse.ArgumentParser
+) -> argparse.ArgumentParser:
+    p = subs.add_parser(name, help=help_text, parents=[common])
+    p.add_argument("artifact", nargs="*", help="artifact type/ref/content")
+    return p
+
+
+def add_actions(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-j", "--json", action="store_true", help="output as JSON")
+    common = _common()
+    subs = parser.add_subparsers(dest="action", required=True, help="ledger action")
+
+    add_p = _action(subs, "add", "add an artifact (i/d/t/r/p)", common)
+    add_p.add_argument("-d", "--domain", help="domain for insight add")
+    add_p.add_argument("-w", "--why", help="rationale for decision add")
+    add_p.add_argument("-r", "--refs", help="references for decision add")
+
+    _action(subs, "list", "list artifacts (i/d/t/p/all)", common)
+    _action(subs, "show", "show artifacts and their threads", common)
+
+    inbox_p = _action(subs, "inbox", "items awaiting you", common)
+    inbox_p.add_argument("--project", help="filter to project scope")
+
+    _action(subs, "commit", "commit a decision", common)
+    reject_p = _action(subs, "reject", "reject a decision", common)
+    reject_p.add_argument("--reason", help="reason for decision reject")
+    action_p = _action(subs, "action", "mark a decision actioned", common)
+    action_p.add_argument("-o", "--outcome", help="outcome for decision action")
+
+    search_p = _action(subs, "search", "search the ledger", common)
+    search_p.add_argument("-n", "--limit", type=int, default=20, help="search result limit")
+    search_p.add_argument("-g", "--all-projects", action="store_true", help="search all projects")
+
+    _action(subs, "close", "mark a task done", common)
+    _action(subs, "cancel", "cancel a task", common)
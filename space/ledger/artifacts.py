@@ -1,19 +1,26 @@
-from datetime import UTC, datetime
-
 from space.core.errors import NotFoundError
 from space.core.types import ArtifactType, ProjectId
 from space.lib import store
 
 
+_RESOLVE_SQL = """
+    SELECT 'insight' AS type, id FROM insights WHERE id >= ? AND id < ? AND likely(deleted_at IS NULL)
+    UNION ALL
+    SELECT 'decision', id FROM decisions WHERE id >= ? AND id < ? AND likely(deleted_at IS NULL)
+    UNION ALL
+    SELECT 'task', id FROM tasks WHERE id >= ? AND id < ? AND likely(deleted_at IS NULL)
+    LIMIT 1
+"""
+
+
 def resolve(parent_id: str) -> tuple[ArtifactType, str]:
+    if not parent_id:
+        raise NotFoundError(f"No artifact found matching '{parent_id}'")
+    bounds = store.prefix_range(parent_id.lower())
     with store.ensure() as conn:
-        for table, ptype in (("insights", "insight"), ("decisions", "decision"), ("tasks", "task")):
-            row = conn.execute(
-                f"SELECT id FROM {table} WHERE id LIKE ? AND deleted_at IS NULL",  # noqa: S608
-                (f"{parent_id}%",),
-            ).fetchone()
-            if row:
-                return ptype, row["id"]  # type: ignore[return-value]
+        row = conn.execute(_RESOLVE_SQL, bounds * 3).fetchone()
+    if row:
+        return row["type"], row["id"]
     raise NotFoundError(f"No artifact found matching '{parent_id}'")
 
 
@@ -21,7 +28,7 @@ def get_project_id(parent_type: ArtifactType, parent_id: str) -> ProjectId | Non
     table = f"{parent_type}s"
     with store.ensure() as conn:
         row = conn.execute(
-            f"SELECT project_id FROM {table} WHERE id = ?",  # noqa: S608
+            f"SELECT project_id FROM {table} WHERE id = ? LIMIT 1",  # noqa: S608
             (parent_id,),
         ).fetchone()
     return ProjectId(row["project_id"]) if row and row["project_id"] else None
@@ -30,12 +37,14 @@ def get_project_id(parent_type: ArtifactType, parent_id: str) -> ProjectId | Non
 def is_closed(parent_type: ArtifactType, parent_id: str) -> bool:
     with store.ensure() as conn:
         if parent_type == "task":
-            row = conn.execute("SELECT status FROM tasks WHERE id = ?", (parent_id,)).fetchone()
+            row = conn.execute(
+                "SELECT status FROM tasks WHERE id = ? LIMIT 1", (parent_id,)
+            ).fetchone()
             return row is not None and row["status"] in ("done", "cancelled")
 
         table = f"{parent_type}s"
         row = conn.execute(
-            f"SELECT archived_at, deleted_at FROM {table} WHERE id = ?",  # noqa: S608
+            f"SELECT archived_at, deleted_at FROM {table} WHERE id = ? LIMIT 1",  # noqa: S608
             (parent_id,),
         ).fetchone()
         if not row:
@@ -43,23 +52,31 @@ def is_closed(parent_type: ArtifactType, parent_id: str) -> bool:
         return row["archived_at"] is not None or row["deleted_at"] is not None
 
 
-def soft_delete(table: str, id: str, typename: str) -> None:
-    now = datetime.now(UTC).isoformat()
+_UPDATE_STMTS: dict[tuple[str, str], str] = {
+    (table, column): (
+        f"UPDATE {table} SET {column} = strftime('%Y-%m-%dT%H:%M:%fZ', 'now') "  # noqa: S608
+        f"WHERE id = ? AND {column} IS NULL"
+    )
+    for table, columns in (
+        ("decisions", ("deleted_at", "archived_at")),
+        ("insights", ("deleted_at", "archived_at")),
+        ("tasks", ("deleted_at",)),
+        ("replies", ("deleted_at",)),
+    )
+    for column in columns
+}
+
+
+def _stamp(table: str, column: str, id: str) -> bool:
     with store.write() as conn:
-        cursor = conn.execute(
-            f"UPDATE {table} SET deleted_at = ? WHERE id = ? AND deleted_at IS NULL",  # noqa: S608
-            (now, id),
-        )
-        if cursor.rowcount == 0:
-            raise NotFoundError(f"{typename} '{id}' not found or already deleted")
+        return conn.execute(_UPDATE_STMTS[table, column], (id,)).rowcount > 0
+
+
+def soft_delete(table: str, id: str, typename: str) -> None:
+    if not _stamp(table, "deleted_at", id):
+        raise NotFoundError(f"{typename} '{id}' not found or already deleted")
 
 
 def archive(table: str, id: str, typename: str) -> None:
-    now = datetime.now(UTC).isoformat()
-    with store.write() as conn:
-        cursor = conn.execute(
-            f"UPDATE {table} SET archived_at = ? WHERE id = ? AND archived_at IS NULL",  # noqa: S608
-            (now, id),
-        )
-        if cursor.rowcount == 0:
-            raise NotFoundError(f"{typename} '{id}' not found or already archived")
+    if not _stamp(table, "archived_at", id):
+        raise NotFoundError(f"{typename} '{id}' not found or already archived")
@@ -1,15 +1,18 @@
 import argparse
 import json
 import sys
-from collections.abc import Callable
-from dataclasses import asdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from space import agents
 from space.agents import identity as identity_lib
 from space.core.errors import NotFoundError, StateError, ValidationError
-from space.core.models import Agent, Decision, Project, Task, TaskStatus
-from space.core.types import ArtifactType, DecisionId, SpawnId
+from space.core.models import Agent, Decision, DecisionStatus, Project, Task, TaskStatus
+from space.core.types import ArtifactType, ProjectId, SpawnId
 from space.ledger import (
     decisions,
     inbox,
@@ -17,65 +20,158 @@ from space.ledger import (
     ledger,
     projects,
     replies,
-    search,
     tasks,
 )
-from space.ledger import (
-    status as status_mod,
-)
+from space.ledger.args import add_actions
 from space.lib import paths, store
 from space.lib.commands import fail
 from space.lib.display import ansi
 from space.lib.display.format import ago
 
 
+_buffer: list[str] | None = None
+
+
 def _out(msg: str) -> None:
-    sys.stdout.write(msg)
+    if _buffer is None:
+        sys.stdout.write(msg)
+    else:
+        _buffer.append(msg)
 
 
-def _decision_mark(d: Decision) -> str:
+@contextmanager
+def _buffered() -> Iterator[None]:
+    global _buffer
+    _buffer = []
+    try:
+        yield
+    finally:
+        parts, _buffer = _buffer, None
+        _write("".join(parts))
+
+
+def _write(text: str) -> None:
+    stream = sys.stdout
+    raw = getattr(stream, "buffer", None)
+    if raw is None:
+        stream.write(text)
+        return
+    stream.flush()
+    raw.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+    raw.flush()
+
+
+def _json_default(obj: object) -> object:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _out_json(payload: object, indent: int | None = 2) -> None:
+    _out(json.dumps(payload, indent=indent, default=_json_default))
+    _out("\n")
+
+
+_DECISION_MARKS: dict[DecisionStatus, tuple[str, str, Callable[[str], str]]] = {
+    DecisionStatus.REJECTED: ("✗", "✗ REJECTED", ansi.red),
+    DecisionStatus.ACTIONED: ("✓", "✓ ACTIONED", ansi.green),
+    DecisionStatus.COMMITTED: ("◆", "◆ COMMITTED", ansi.yellow),
+    DecisionStatus.PROPOSED: ("◇", "◇ PROPOSED", ansi.gray),
+}
+
+
+def _decision_state(d: Decision) -> DecisionStatus:
     if d.rejected_at:
-        return "✗"
+        return DecisionStatus.REJECTED
     if d.actioned_at:
-        return "✓"
+        return DecisionStatus.ACTIONED
     if d.committed_at:
-        return "◆"
-    return "◇"
+        return DecisionStatus.COMMITTED
+    return DecisionStatus.PROPOSED
+
+
+def _decision_mark(d: Decision) -> str:
+    return _DECISION_MARKS[_decision_state(d)][0]
 
 
 def _decision_status(d: Decision) -> tuple[str, Callable[[str], str]]:
-    if d.rejected_at:
-        return "✗ REJECTED", ansi.red
-    if d.actioned_at:
-        return "✓ ACTIONED", ansi.green
-    if d.committed_at:
-        return "◆ COMMITTED", ansi.yellow
-    return "◇ PROPOSED", ansi.gray
+    _, label, color = _DECISION_MARKS[_decision_state(d)]
+    return label, color
+
+
+@dataclass(frozen=True, slots=True)
+class _Style:
+    dim: Callable[[str], str]
+    gray: Callable[[str], str]
+    bold: Callable[[str], str]
+    cyan: Callable[[str], str]
+    white: Callable[[str], str]
+    labels: dict[str, str]
+    thread_line: str
+
+
+@lru_cache(maxsize=1)
+def _stdout_tty() -> bool:
+    return sys.stdout.isatty()
+
+
+@lru_cache(maxsize=1)
+def _home() -> str:
+    return str(Path.home())
+
+
+_LABELS = (
+    "@",
+    "Author:",
+    "Created:",
+    "Committed:",
+    "Actioned:",
+    "Rejected:",
+    "Rationale:",
+    "Outcome:",
+    "Reason:",
+    "Status:",
+)
+_RULE = "─" * 40
+_DONE = TaskStatus.DONE
+_PLAIN_STYLE = _Style(
+    str, str, str, str, str, {**{k: k for k in _LABELS}, "rule": _RULE}, "  %s @%s: %s\n"
+)
 
 
-def _fmt(label: str, value: str, tty: bool) -> str:
-    if tty:
-        return f"{ansi.dim(label)} {ansi.gray(value)}"
-    return f"{label} {value}"
+@lru_cache(maxsize=1)
+def _style() -> _Style:
+    if not _stdout_tty():
+        return _PLAIN_STYLE
+    return _Style(
+        ansi.dim,
+        ansi.gray,
+        ansi.bold,
+        ansi.cyan,
+        ansi.white,
+        {**{k: ansi.dim(k) for k in _LABELS}, "rule": ansi.dim(_RULE)},
+        f"  {ansi.cyan('%s')} {ansi.dim('@')}{ansi.gray('%s')}: {ansi.dim('%s')}\n",
+    )
 
 
 def _resolve_agent(ref: str | None = None) -> Agent:
     return agents.get_by_handle(ref or identity_lib.current() or fail("Missing: --as or SPACE_IDENTITY"))
 
 
+@_buffered()
 def route(args: argparse.Namespace) -> None:
-    {
-        "add": _add,
-        "list": _list,
-        "show": _show,
-        "inbox": _inbox,
-        "commit": _commit,
-        "reject": _reject,
-        "action": _action,
-        "search": _search,
-        "close": _close,
-        "cancel": _cancel,
-    }[args.action](args)
+    handler = _DISPATCH.get(args.action)
+    if handler is None:
+        fail(f"Unknown action: {args.action}")
+    handler(args)
+
+
+@dataclass(frozen=True, slots=True)
+class _AddContext:
+    agent: Agent
+    project_id: ProjectId
+    spawn_id: SpawnId | None
+    content: str
 
 
 def _add(args: argparse.Namespace) -> None:
@@ -93,182 +189,229 @@ def _add(args: argparse.Namespace) -> None:
     project_id = projects.get_scope()
     spawn_id = SpawnId(sid) if (sid := paths.spawn_id()) else None
 
-    if type_arg == "i":
-        if not args.domain:
-            fail("--domain required for insight add")
-        try:
-            entry = insights.create(
-                project_id,
-                agent.id,
-                content,
-                args.domain,
-                spawn_id=spawn_id,
-            )
-            _out(f"{store.ref('insights', entry.id)}\n")
-        except ValidationError as e:
-            fail(str(e))
-    elif type_arg == "t":
-        entry = tasks.create(project_id, agent.id, content, spawn_id=spawn_id)
-        _out(f"{store.ref('tasks', entry.id)}\n")
-    elif type_arg == "d":
-        if not args.why:
-            fail("--why <rationale> required for decision add")
-        try:
-            entry = decisions.create(
-                project_id,
-                agent.id,
-                content,
-                args.why,
-                spawn_id=spawn_id,
-                refs=args.refs,
-            )
-            _out(f"{store.ref('decisions', entry.id)}\n")
-        except ValidationError as e:
-            fail(str(e))
-    elif type_arg == "r":
-        if len(content_args) < 2:
-            fail("Usage: ledger add r <ref> <message>")
-        ref = content_args[0]
-        message = " ".join(content_args[1:])
-        try:
-            reply_entry = replies.create_by_ref(ref, agent.id, message, spawn_id=spawn_id)
-            _out(f"{store.ref('replies', reply_entry.id)}\n")
-        except (ValidationError, NotFoundError) as e:
-            fail(str(e))
-    elif type_arg == "p":
-        try:
-            project_entry = projects.create(content_args[0])
-            _out(f"Project: {project_entry.name} ({project_entry.id[:8]})\n")
-        except Exception as e:
-            fail(str(e))
-    else:
+    handler = _ADD_HANDLERS.get(type_arg)
+    if handler is None:
         fail(f"Unknown type for add: {type_arg}")
+    handler(args, content_args, _AddContext(agent, project_id, spawn_id, content))
+
+
+def _add_insight(args: argparse.Namespace, content_args: list[str], ctx: _AddContext) -> None:
+    if not args.domain:
+        fail("--domain required for insight add")
+    try:
+        entry = insights.create(
+            ctx.project_id,
+            ctx.agent.id,
+            ctx.content,
+            args.domain,
+            spawn_id=ctx.spawn_id,
+        )
+        _out(f"{store.ref('insights', entry.id)}\n")
+    except ValidationError as e:
+        fail(str(e))
+
+
+def _add_task(args: argparse.Namespace, content_args: list[str], ctx: _AddContext) -> None:
+    entry = tasks.create(ctx.project_id, ctx.agent.id, ctx.content, spawn_id=ctx.spawn_id)
+    _out(f"{store.ref('tasks', entry.id)}\n")
+
+
+def _add_decision(args: argparse.Namespace, content_args: list[str], ctx: _AddContext) -> None:
+    if not args.why:
+        fail("--why <rationale> required for decision add")
+    try:
+        entry = decisions.create(
+            ctx.project_id,
+            ctx.agent.id,
+            ctx.content,
+            args.why,
+            spawn_id=ctx.spawn_id,
+            refs=args.refs,
+        )
+        _out(f"{store.ref('decisions', entry.id)}\n")
+    except ValidationError as e:
+        fail(str(e))
+
+
+def _add_reply(args: argparse.Namespace, content_args: list[str], ctx: _AddContext) -> None:
+    if len(content_args) < 2:
+        fail("Usage: ledger add r <ref> <message>")
+    ref = content_args[0]
+    message = " ".join(content_args[1:])
+    try:
+        reply_entry = replies.create_by_ref(ref, ctx.agent.id, message, spawn_id=ctx.spawn_id)
+        _out(f"{store.ref('replies', reply_entry.id)}\n")
+    except (ValidationError, NotFoundError) as e:
+        fail(str(e))
+
+
+def _add_project(args: argparse.Namespace, content_args: list[str], ctx: _AddContext) -> None:
+    try:
+        project_entry = projects.create(content_args[0])
+        _out(f"Project: {project_entry.name} ({project_entry.id[:8]})\n")
+    except Exception as e:
+        fail(str(e))
+
+
+_ADD_HANDLERS: dict[str, Callable[[argparse.Namespace, list[str], _AddContext], None]] = {
+    "i": _add_insight,
+    "t": _add_task,
+    "d": _add_decision,
+    "r": _add_reply,
+    "p": _add_project,
+}
 
 
 def _list(args: argparse.Namespace) -> None:
     project_id = projects.get_scope()
     type_arg = args.artifact[0] if args.artifact else "t"
 
-    if type_arg == "all":
-        items = ledger.fetch(limit=50, project_id=project_id)
-        for item in items:
-            _out(f"[{item.created_at}] {item.handle}: {item.content}\n")
-
-    elif type_arg == "i":
-        entries = insights.fetch(project_id=project_id, limit=50)
-        for e in entries:
-            try:
-                agent = agents.get(e.agent_id)
-                handle = agent.handle
-            except NotFoundError:
-                handle = "unknown"
-            _out(f"[{store.ref('insights', e.id)}] @{handle}: {e.content}\n")
-    elif type_arg == "t":
-        task_list = tasks.fetch(project_id=project_id, limit=50)
-        for t in task_list:
-            mark = "✓" if t.status == TaskStatus.DONE else " "
-            ref = store.ref("tasks", t.id)
-            _out(f"{mark} {ref} {t.content}\n")
-    elif type_arg == "d":
-        decision_list = decisions.fetch(project_id=project_id, limit=50)
-        for d in decision_list:
-            ref = store.ref("decisions", d.id)
-            _out(f"{_decision_mark(d)} {ref} {d.content}\n")
-    elif type_arg == "p":
-        project_list = projects.fetch()
-        if not project_list:
-            _out("No projects found.\n")
-            return
+    handler = _LIST_HANDLERS.get(type_arg)
+    if handler is None:
+        fail(f"Unknown type for list: {type_arg}")
+    handler(project_id)
 
-        project_ids = [p.id for p in project_list]
-        last_active_map = projects.batch_last_active(project_ids)
-        artifact_count_map = projects.batch_artifact_counts(project_ids)
 
-        projects_sorted = sorted(
-            project_list,
-            key=lambda p: last_active_map.get(p.id) or "",
-            reverse=True,
-        )
+def _list_all(project_id: ProjectId) -> None:
+    items = ledger.fetch(limit=50, project_id=project_id)
+    for item in items:
+        _out(f"[{item.created_at}] {item.handle}: {item.content}\n")
 
-        home = str(Path.home())
-        rows = []
-        for p in projects_sorted:
-            count = artifact_count_map.get(p.id, 0)
-            last = last_active_map.get(p.id)
-            path = p.repo_path or "-"
-            if path != "-" and path.startswith(home):
-                path = "~" + path[len(home) :]
-            tags = ",".join(p.tags) if p.tags else ""
-            rows.append((p.name, str(count), ago(last), path, tags))
-
-        name_w = max(len(r[0]) for r in rows)
-        art_w = max(len(r[1]) for r in rows)
-        act_w = max(len(r[2]) for r in rows)
-        path_w = max(len(r[3]) for r in rows)
 
+def _list_insights(project_id: ProjectId) -> None:
+    entries = insights.fetch(project_id=project_id, limit=50)
+    agent_map = agents.batch_get([e.agent_id for e in entries])
+    for e in entries:
+        handle = agent.handle if (agent := agent_map.get(e.agent_id)) else "unknown"
+        _out(f"[i/{e.id[:8]}] @{handle}: {e.content}\n")
+
+
+def _list_tasks(project_id: ProjectId) -> None:
+    task_list = tasks.fetch(project_id=project_id, limit=50)
+    for t in task_list:
+        mark = "✓" if t.status is _DONE else " "
+        _out(f"{mark} t/{t.id[:8]} {t.content}\n")
+
+
+def _list_decisions(project_id: ProjectId) -> None:
+    decision_list = decisions.fetch(project_id=project_id, limit=50)
+    for d in decision_list:
+        _out(f"{_decision_mark(d)} d/{d.id[:8]} {d.content}\n")
+
+
+def _list_projects(_project_id: ProjectId) -> None:
+    project_list = projects.fetch_with_stats()
+    if not project_list:
+        _out("No projects found.\n")
+        return
+
+    home = _home()
+    home_len, home_dir = len(home), home + "/"
+    rows = []
+    name_w = art_w = act_w = path_w = 0
+    for p, last, count in sorted(project_list, key=lambda row: row[1] or "", reverse=True):
+        path = p.repo_path or "-"
+        if path == home or path.startswith(home_dir):
+            path = "~" + path[home_len:]
+        tags = ",".join(p.tags) if p.tags else ""
+        count_str, active = str(count), ago(last)
+        rows.append((p.name, count_str, active, path, tags))
+        name_w = max(name_w, len(p.name))
+        art_w = max(art_w, len(count_str))
+        act_w = max(act_w, len(active))
+        path_w = max(path_w, len(path))
+
+    _out(
+        f"{'name':<{name_w}} {'artifacts':<{art_w}} {'active':<{act_w}} {'path':<{path_w}} {'tags'}\n"
+    )
+    _out("-" * (name_w + art_w + act_w + path_w + 20) + "\n")
+
+    for name, count, last, path, tags in rows:
         _out(
-            f"{'name':<{name_w}} {'artifacts':<{art_w}} {'active':<{act_w}} {'path':<{path_w}} {'tags'}\n"
+            f"{name:<{name_w}} {count:<{art_w}} {last:<{act_w}} {path:<{path_w}} {tags}\n"
         )
-        _out("-" * (name_w + art_w + act_w + path_w + 20) + "\n")
 
-        for name, count, last, path, tags in rows:
-            _out(
-                f"{name:<{name_w}} {count:<{art_w}} {last:<{act_w}} {path:<{path_w}} {tags}\n"
-            )
-    else:
-        fail(f"Unknown type for list: {type_arg}")
+
+_LIST_HANDLERS: dict[str, Callable[[ProjectId], None]] = {
+    "all": _list_all,
+    "i": _list_insights,
+    "t": _list_tasks,
+    "d": _list_decisions,
+    "p": _list_projects,
+}
 
 
 def _show(args: argparse.Namespace) -> None:
     if not args.artifact:
         fail("ref required for show")
 
-    ref = args.artifact[0]
-
-    # Handle project show by name (no prefix)
-    if "/" not in ref:
-        try:
-            project = store.resolve(ref, "projects", Project)
-            _out(f"Project: {project.name}\n")
-            _out(f"ID: {project.id}\n")
-            _out(f"Repo: {project.repo_path}\n")
-            return
-        except NotFoundError:
-            pass
-
-    # Use ledger.thread for unified show
     try:
-        if "/" in ref:
-            prefix, short_id = ref.split("/", 1)
-            table_map = {"i": "insight", "d": "decision", "t": "task"}
-            item_type = table_map.get(prefix)
-            if not item_type:
-                fail(f"Invalid prefix: {prefix}")
-        else:
-            fail("Ref must be prefixed (i/xxx, d/xxx, t/xxx) or a project name")
+        resolved = [_resolve_show_ref(ref) for ref in args.artifact]
 
-        main_item, thread_items = ledger.thread(item_type, short_id)
-        if not main_item:
-            fail(f"Not found: {ref}")
+        reads: list[tuple[ArtifactType, str]] = []
+        payloads: list[dict[str, Any]] = []
+        for i, (ref, target) in enumerate(resolved):
+            if i and not args.json:
+                _out("\n")
+            _show_ref(ref, target, args.json, reads, payloads)
 
-        if args.json:
-            _show_json(main_item, thread_items, ref, item_type)
-        else:
-            _show_formatted(main_item, thread_items, ref, item_type)
+        if payloads:
+            _out_json(payloads[0] if len(payloads) == 1 else payloads)
 
         # Mark as read (clears from inbox)
-        agent = _resolve_agent(None)
-        spawn_id = SpawnId(sid) if (sid := paths.spawn_id()) else None
-        full_id = main_item.id
-        artifact_type: ArtifactType = item_type  # type: ignore[assignment]
-        inbox.mark_read(artifact_type, full_id, agent.id, spawn_id)
+        if reads:
+            agent = _resolve_agent(None)
+            spawn_id = SpawnId(sid) if (sid := paths.spawn_id()) else None
+            inbox.mark_read_many(reads, agent.id, spawn_id)
 
     except Exception as e:
         fail(f"Error: {e}")
 
 
-def _show_json(main_item, thread_items, ref: str, item_type: str) -> None:
-    data = {
+def _resolve_show_ref(ref: str) -> tuple[str, Any]:
+    # Handle project show by name (no prefix)
+    if "/" not in ref:
+        try:
+            return ref, store.resolve(ref, "projects", Project)
+        except NotFoundError:
+            fail("Ref must be prefixed (i/xxx, d/xxx, t/xxx) or a project name")
+
+    # Use ledger.thread for unified show
+    prefix, short_id = ref.split("/", 1)
+    table_map: dict[str, ArtifactType] = {"i": "insight", "d": "decision", "t": "task"}
+    item_type = table_map.get(prefix)
+    if not item_type:
+        fail(f"Invalid prefix: {prefix}")
+
+    main_item, thread_items = ledger.thread(item_type, short_id)
+    if not main_item:
+        fail(f"Not found: {ref}")
+    return ref, (item_type, main_item, thread_items)
+
+
+def _show_ref(
+    ref: str,
+    target: Any,
+    as_json: bool,
+    reads: list[tuple[ArtifactType, str]],
+    payloads: list[dict[str, Any]],
+) -> None:
+    if isinstance(target, Project):
+        _out(f"Project: {target.name}\n")
+        _out(f"ID: {target.id}\n")
+        _out(f"Repo: {target.repo_path}\n")
+        return
+
+    item_type, main_item, thread_items = target
+    if as_json:
+        payloads.append(_show_payload(main_item, thread_items, ref, item_type))
+    else:
+        _show_formatted(main_item, thread_items, ref)
+    reads.append((item_type, main_item.id))
+
+
+def _show_payload(main_item, thread_items, ref: str, item_type: str) -> dict[str, Any]:
+    data: dict[str, Any] = {
         "ref": ref,
         "id": main_item.id,
         "type": item_type,
@@ -281,19 +424,18 @@ def _show_json(main_item, thread_items, ref: str, item_type: str) -> None:
     if main_item.status:
         data["status"] = main_item.status
 
-    if item_type == "decision":
-        try:
-            decision = decisions.get(DecisionId(main_item.id))
-            if decision.committed_at:
-                data["committed_at"] = decision.committed_at
-            if decision.actioned_at:
-                data["actioned_at"] = decision.actioned_at
-            if decision.rejected_at:
-                data["rejected_at"] = decision.rejected_at
-            if hasattr(decision, "outcome") and decision.outcome:
-                data["outcome"] = decision.outcome
-        except NotFoundError:
-            pass
+    decision = main_item.decision
+    if decision:
+        if decision.committed_at:
+            data["committed_at"] = decision.committed_at
+        if decision.actioned_at:
+            data["actioned_at"] = decision.actioned_at
+        if decision.rejected_at:
+            data["rejected_at"] = decision.rejected_at
+        if decision.rejection_reason:
+            data["rejection_reason"] = decision.rejection_reason
+        if decision.outcome:
+            data["outcome"] = decision.outcome
 
     if thread_items:
         data["thread"] = [
@@ -306,104 +448,87 @@ def _show_json(main_item, thread_items, ref: str, item_type: str) -> None:
             }
             for item in thread_items
         ]
-    _out(json.dumps(data, indent=2))
-    _out("\n")
+    return data
 
 
-def _show_formatted(main_item, thread_items, ref: str, item_type: str) -> None:
-    tty = sys.stdout.isatty()
+def _show_formatted(main_item, thread_items, ref: str) -> None:
+    tty = _stdout_tty()
+    style = _style()
 
-    if item_type == "decision":
-        try:
-            decision = decisions.get(DecisionId(main_item.id))
-            _render_decision_card(decision, ref, tty)
-        except NotFoundError:
-            _render_generic(main_item, ref, tty)
+    if main_item.decision:
+        _render_decision_card(main_item.decision, main_item.handle, ref, style)
     else:
-        _render_generic(main_item, ref, tty)
+        _render_generic(main_item, ref, style)
 
     if thread_items:
         if tty:
-            _out(f"\n{ansi.dim('─' * 40)}\n")
+            _out(f"\n{style.labels['rule']}\n")
             _out(f"{ansi.gray(f'{len(thread_items)} related')}\n\n")
         else:
             _out(f"\n--- {len(thread_items)} related ---\n")
 
-        for item in thread_items:
-            item_ref = f"{item.type[0]}/{item.id[:8]}"
-            if tty:
-                _out(f"  {ansi.cyan(item_ref)} ")
-                _out(f"{ansi.dim('@')}{ansi.gray(item.handle)}: ")
-                _out(f"{ansi.dim(item.content[:80])}\n")
-            else:
-                _out(f"  {item_ref} @{item.handle}: {item.content[:80]}\n")
-
-
-def _render_generic(item, ref: str, tty: bool) -> None:
-    if tty:
-        _out(f"{ansi.bold('[')}{ansi.cyan(ref)}{ansi.bold(']')} ")
-        _out(f"{ansi.dim('@')}{ansi.gray(item.handle)}: ")
-        _out(f"{ansi.white(item.content)}\n")
-    else:
-        _out(f"[{ref}] @{item.handle}: {item.content}\n")
+        line = style.thread_line
+        _out(
+            "".join(
+                line % (f"{item.type[0]}/{item.id[:8]}", item.handle, item.content[:80])
+                for item in thread_items
+            )
+        )
+
+
+def _render_generic(item, ref: str, style: _Style) -> None:
+    _out(
+        f"{style.bold('[')}{style.cyan(ref)}{style.bold(']')} "
+        f"{style.labels['@']}{style.gray(item.handle)}: {style.white(item.content)}\n"
+    )
 
     if item.rationale:
-        label = ansi.dim("Rationale:") if tty else "Rationale:"
-        _out(f"{label} {item.rationale}\n")
+        _out(f"{style.labels['Rationale:']} {item.rationale}\n")
     if item.status:
-        label = ansi.dim("Status:") if tty else "Status:"
-        status = ansi.bold(item.status) if tty else item.status
-        _out(f"{label} {status}\n")
+        _out(f"{style.labels['Status:']} {style.bold(item.status)}\n")
 
 
-def _render_decision_card(decision: Decision, ref: str, tty: bool) -> None:
+def _render_decision_card(decision: Decision, handle: str, ref: str, style: _Style) -> None:
+    gray, label = style.gray, style.labels
     mark, color = _decision_status(decision)
-    if tty:
-        _out(f"{ansi.bold(color(mark))} {ansi.cyan(ref)}\n{ansi.dim('─' * 40)}\n")
-    else:
-        _out(f"{mark} {ref}\n{'─' * 40}\n")
+    if style is _PLAIN_STYLE:
+        color = str
+    _out(f"{style.bold(color(mark))} {style.cyan(ref)}\n{label['rule']}\n")
 
     _out(f"{decision.content}\n\n")
 
-    agent = agents.get(decision.agent_id)
-    _out(f"{_fmt('Author:', f'@{agent.handle}', tty)}\n")
-    _out(f"{_fmt('Created:', ago(decision.created_at), tty)}\n")
+    _out(f"{label['Author:']} {gray(f'@{handle}')}\n")
+    _out(f"{label['Created:']} {gray(ago(decision.created_at))}\n")
 
     if decision.committed_at:
-        _out(f"{_fmt('Committed:', ago(decision.committed_at), tty)}\n")
+        _out(f"{label['Committed:']} {gray(ago(decision.committed_at))}\n")
     if decision.actioned_at:
-        _out(f"{_fmt('Actioned:', ago(decision.actioned_at), tty)}\n")
+        _out(f"{label['Actioned:']} {gray(ago(decision.actioned_at))}\n")
     if decision.rejected_at:
-        _out(f"{_fmt('Rejected:', ago(decision.rejected_at), tty)}\n")
+        _out(f"{label['Rejected:']} {gray(ago(decision.rejected_at))}\n")
 
     if decision.rationale:
-        _out("\n")
-        if tty:
-            _out(f"{ansi.dim('Rationale:')}\n{ansi.gray(decision.rationale)}\n")
-        else:
-            _out(f"Rationale:\n{decision.rationale}\n")
+        _out(f"\n{label['Rationale:']}\n{gray(decision.rationale)}\n")
 
     if hasattr(decision, "outcome") and decision.outcome:
-        _out("\n")
-        if tty:
-            _out(f"{ansi.dim('Outcome:')}\n{ansi.gray(decision.outcome)}\n")
-        else:
-            _out(f"Outcome:\n{decision.outcome}\n")
+        _out(f"\n{label['Outcome:']}\n{gray(decision.outcome)}\n")
+
+    if decision.rejection_reason:
+        _out(f"\n{label['Reason:']}\n{gray(decision.rejection_reason)}\n")
 
 
 def _inbox(args: argparse.Namespace) -> None:
     agent = _resolve_agent(None)
     current_handle = agent.handle
 
-    project_id = projects.get_scope(args.project) if hasattr(args, "project") else None
+    project_id = projects.get_scope(args.project)
     items = inbox.fetch(current_handle, project_id=project_id)
     if not items:
         _out("Inbox empty\n")
         return
 
     if args.json:
-        _out(json.dumps([asdict(i) for i in items], indent=2))
-        _out("\n")
+        _out_json(items)
         return
 
     for item in items:
@@ -418,8 +543,7 @@ def _commit(args: argparse.Namespace) -> None:
         decision = store.resolve(decision_ref, "decisions", Decision)
         updated = decisions.commit(decision.id)
         if args.json:
-            _out(json.dumps(asdict(updated), indent=2))
-            _out("\n")
+            _out_json(updated)
         else:
             _out(f"Committed: {store.ref('decisions', decision.id)}\n")
     except (NotFoundError, ValidationError) as e:
@@ -432,12 +556,13 @@ def _reject(args: argparse.Namespace) -> None:
     decision_ref = args.artifact[0]
     try:
         decision = store.resolve(decision_ref, "decisions", Decision)
-        updated = decisions.reject(decision.id)
+        updated = decisions.reject(decision.id, reason=args.reason)
         if args.json:
-            _out(json.dumps(asdict(updated), indent=2))
-            _out("\n")
+            _out_json(updated)
         else:
             _out(f"Rejected: {store.ref('decisions', decision.id)}\n")
+            if args.reason:
+                _out(f"Reason: {args.reason}\n")
     except (NotFoundError, ValidationError) as e:
         fail(str(e))
 
@@ -450,8 +575,7 @@ def _action(args: argparse.Namespace) -> None:
         decision = store.resolve(decision_ref, "decisions", Decision)
         updated = decisions.action(decision.id, outcome=args.outcome)
         if args.json:
-            _out(json.dumps(asdict(updated), indent=2))
-            _out("\n")
+            _out_json(updated)
         else:
             _out(f"Actioned: {store.ref('decisions', decision.id)}\n")
             if args.outcome:
@@ -461,6 +585,8 @@ def _action(args: argparse.Namespace) -> None:
 
 
 def _search(args: argparse.Namespace) -> None:
+    from space.ledger import search  # noqa: PLC0415
+
     if not args.artifact:
         fail("query required for search")
 
@@ -470,7 +596,7 @@ def _search(args: argparse.Namespace) -> None:
     results = search.query(
         query_str,
         scope="all",
-        limit=args.limit if hasattr(args, "limit") else 20,
+        limit=args.limit,
         project_id=project_id,
     )
 
@@ -486,8 +612,9 @@ def _search(args: argparse.Namespace) -> None:
             }
             for r in results
         ]
-        _out(json.dumps({"query": query_str, "results": data}, indent=2))
-        _out("\n")
+        _out_json(
+            {"query": query_str, "results": data}, indent=2 if _stdout_tty() else None
+        )
     else:
         if not results:
             _out(f"No results for '{query_str}'\n")
@@ -528,7 +655,24 @@ def _cancel(args: argparse.Namespace) -> None:
         fail(str(e))
 
 
+_DISPATCH: dict[str, Callable[[argparse.Namespace], None]] = {
+    "add": _add,
+    "list": _list,
+    "show": _show,
+    "inbox": _inbox,
+    "commit": _commit,
+    "reject": _reject,
+    "action": _action,
+    "search": _search,
+    "close": _close,
+    "cancel": _cancel,
+}
+
+
+@_buffered()
 def status_cmd(agent_handle: str | None = None, json_output: bool = False) -> None:
+    from space.ledger import status as status_mod  # noqa: PLC0415
+
     data = status_mod.get(agent_handle)
 
     if json_output:
@@ -544,8 +688,7 @@ def status_cmd(agent_handle: str | None = None, json_output: bool = False) -> No
             ],
             "inbox": [{"id": i.id, "content": i.content} for i in data.inbox],
         }
-        _out(json.dumps(payload, indent=2))
-        _out("\n")
+        _out_json(payload)
         return
 
     for project in data.projects:
@@ -570,30 +713,6 @@ def status_cmd(agent_handle: str | None = None, json_output: bool = False) -> No
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog="ledger", description="unified ledger access")
-    parser.add_argument(
-        "action",
-        choices=[
-            "add",
-            "list",
-            "show",
-            "inbox",
-            "commit",
-            "reject",
-            "action",
-            "search",
-            "close",
-            "cancel",
-        ],
-        help="ledger action",
-    )
-    parser.add_argument("artifact", nargs="*", help="artifact type/ref/content")
-    parser.add_argument("-d", "--domain", help="domain for insight add")
-    parser.add_argument("-w", "--why", help="rationale for decision add")
-    parser.add_argument("-r", "--refs", help="references for decision add")
-    parser.add_argument("-o", "--outcome", help="outcome for decision action")
-    parser.add_argument("-n", "--limit", type=int, default=20, help="search result limit")
-    parser.add_argument("-g", "--all-projects", action="store_true", help="search all projects")
-    parser.add_argument("--project", help="filter to project scope")
-    parser.add_argument("-j", "--json", action="store_true", help="output as JSON")
+    add_actions(parser)
     args = parser.parse_args()
     route(args)
@@ -1,4 +1,5 @@
 import json
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from space import agents
@@ -8,15 +9,28 @@ from space.core.models import Decision, DecisionStatus, Insight
 from space.core.types import AgentId, DecisionId, ProjectId, SpawnId
 from space.ledger import artifacts
 from space.lib import citations, store
+from space.lib.store.sqlite import placeholders
 
 
-def _check_duplicate(content: str, project_id: ProjectId) -> DecisionId | None:
+@dataclass
+class NewDecision:
+    agent_id: AgentId
+    content: str
+    rationale: str
+    spawn_id: SpawnId | None = None
+    images: list[str] | None = None
+    expected_outcome: str | None = None
+    refs: str | None = None
+    reversible: bool | None = None
+
+
+def _check_duplicates(contents: list[str], project_id: ProjectId) -> list[DecisionId]:
     with store.ensure() as conn:
-        row = conn.execute(
-            "SELECT id FROM decisions WHERE content = ? AND project_id = ? AND deleted_at IS NULL",
-            (content, project_id),
-        ).fetchone()
-        return DecisionId(row["id"]) if row else None
+        rows = conn.execute(
+            f"SELECT id FROM decisions WHERE project_id = ? AND deleted_at IS NULL AND content IN ({placeholders(contents)})",  # noqa: S608
+            (project_id, *contents),
+        ).fetchall()
+        return [DecisionId(row["id"]) for row in rows]
 
 
 def create(
@@ -30,39 +44,80 @@ def create(
     refs: str | None = None,
     reversible: bool | None = None,
 ) -> Decision:
-    if not rationale or not rationale.strip():
-        raise ValidationError("rationale is required")
-
-    existing = _check_duplicate(content, project_id)
+    entry = NewDecision(
+        agent_id, content, rationale, spawn_id, images, expected_outcome, refs, reversible
+    )
+    return create_many(project_id, [entry])[0]
+
+
+def create_many(project_id: ProjectId, entries: list[NewDecision]) -> list[Decision]:
+    if not entries:
+        return []
+    for entry in entries:
+        if not entry.rationale or not entry.rationale.strip():
+            raise ValidationError("rationale is required")
+
+    contents = [entry.content for entry in entries]
+    if len(set(contents)) < len(contents):
+        raise ValidationError("Duplicate decision content in batch")
+    existing = _check_duplicates(contents, project_id)
     if existing:
-        raise ValidationError(f"Duplicate decision exists: {existing}")
+        raise ValidationError(f"Duplicate decision exists: {', '.join(existing)}")
 
-    decision_id = DecisionId(ids.generate("decisions"))
     now = datetime.now(UTC).isoformat()
+    values = [
+        (
+            project_id,
+            entry.agent_id,
+            entry.spawn_id,
+            entry.content,
+            entry.rationale,
+            json.dumps(entry.images) if entry.images else None,
+            entry.expected_outcome,
+            entry.refs,
+            1 if entry.reversible is True else (0 if entry.reversible is False else None),
+            now,
+        )
+        for entry in entries
+    ]
+    citation_texts = [
+        f"{entry.content} {entry.rationale} {entry.refs}"
+        if entry.refs
+        else f"{entry.content} {entry.rationale}"
+        for entry in entries
+    ]
+    agent_ids = list(dict.fromkeys(entry.agent_id for entry in entries))
 
     with store.write() as conn:
-        store.unarchive("agents", agent_id, conn)
-        conn.execute(
+        decision_ids: list[DecisionId] = []
+        for _ in entries:
+            decision_id = DecisionId(ids.generate("decisions", conn))
+            while decision_id in decision_ids:
+                decision_id = DecisionId(ids.generate("decisions", conn))
+            decision_ids.append(decision_id)
+        for agent_id in agent_ids:
+            store.unarchive("agents", agent_id, conn)
+        conn.executemany(
             "INSERT INTO decisions (id, project_id, agent_id, spawn_id, content, rationale, images, expected_outcome, refs, reversible, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                decision_id,
-                project_id,
-                agent_id,
-                spawn_id,
-                content,
-                rationale,
-                json.dumps(images) if images else None,
-                expected_outcome,
-                refs,
-                1 if reversible is True else (0 if reversible is False else None),
-                now,
-            ),
+            [
+                (decision_id, *row)
+                for decision_id, row in zip(decision_ids, values, strict=True)
+            ],
         )
-        citation_text = f"{content} {rationale}"
-        if refs:
-            citation_text = f"{citation_text} {refs}"
-        citations.store(conn, "decision", decision_id, citation_text)
-    return get(decision_id)
+        citations.store_many(
+            conn, "decision", list(zip(decision_ids, citation_texts, strict=True))
+        )
+    created = batch_get(decision_ids)
+    return [created[decision_id] for decision_id in decision_ids]
+
+
+def batch_get(decision_ids: list[DecisionId]) -> dict[DecisionId, Decision]:
+    if not decision_ids:
+        return {}
+    ph = placeholders(decision_ids)
+    with store.ensure() as conn:
+        rows = conn.execute(f"SELECT * FROM decisions WHERE id IN ({ph})", decision_ids).fetchall()  # noqa: S608
+        return {DecisionId(row["id"]): store.from_row(row, Decision) for row in rows}
 
 
 def get(decision_id: DecisionId) -> Decision:
@@ -98,13 +153,13 @@ def delete(decision_id: DecisionId) -> None:
 
 def reassign(decision_id: DecisionId, project_id: ProjectId) -> Decision:
     with store.write() as conn:
-        cursor = conn.execute(
-            "UPDATE decisions SET project_id = ? WHERE id = ? AND deleted_at IS NULL",
+        row = conn.execute(
+            "UPDATE decisions SET project_id = ? WHERE id = ? AND deleted_at IS NULL RETURNING *",
             (project_id, decision_id),
-        )
-        if cursor.rowcount == 0:
+        ).fetchone()
+        if row is None:
             raise NotFoundError(f"Decision '{decision_id}' not found")
-    return get(decision_id)
+    return store.from_row(row, Decision)
 
 
 def archive(decision_id: DecisionId) -> Decision:
@@ -129,11 +184,57 @@ def action(
 
     now = at or datetime.now(UTC).isoformat()
     with store.write() as conn:
-        conn.execute(
-            "UPDATE decisions SET actioned_at = ?, outcome = ? WHERE id = ?",
+        row = conn.execute(
+            "UPDATE decisions SET actioned_at = ?, outcome = ? WHERE id = ? RETURNING *",
             (now, outcome, decision_id),
-        )
-    return get(decision_id)
+        ).fetchone()
+    return store.from_row(row, Decision)
+
+
+_STATUS_BY_VALUE = {s.value: s for s in DecisionStatus}
+
+_INSIGHT_AFTER_ACTION = (
+    "EXISTS (SELECT 1 FROM insights i WHERE i.decision_id = d.id "
+    "AND i.deleted_at IS NULL AND i.created_at > d.actioned_at)"
+)
+
+_STATUS_CONDITIONS: dict[DecisionStatus, tuple[str, ...]] = {
+    DecisionStatus.PROPOSED: ("d.rejected_at IS NULL", "d.committed_at IS NULL"),
+    DecisionStatus.COMMITTED: (
+        "d.rejected_at IS NULL",
+        "d.committed_at IS NOT NULL",
+        "d.actioned_at IS NULL",
+    ),
+    DecisionStatus.ACTIONED: (
+        "d.rejected_at IS NULL",
+        "d.committed_at IS NOT NULL",
+        "d.actioned_at IS NOT NULL",
+        f"NOT {_INSIGHT_AFTER_ACTION}",
+    ),
+    DecisionStatus.LEARNED: (
+        "d.rejected_at IS NULL",
+        "d.committed_at IS NOT NULL",
+        "d.actioned_at IS NOT NULL",
+        _INSIGHT_AFTER_ACTION,
+    ),
+    DecisionStatus.REJECTED: ("d.rejected_at IS NOT NULL",),
+}
+
+
+def _status_sql(status: DecisionStatus, scoped: bool) -> str:
+    conditions = ["d.deleted_at IS NULL", "d.archived_at IS NULL"]
+    if scoped:
+        conditions.append("d.project_id = ?")
+    conditions.extend(_STATUS_CONDITIONS[status])
+    where = " AND ".join(conditions)
+    return f"SELECT d.* FROM decisions d WHERE {where} ORDER BY d.created_at DESC"  # noqa: S608
+
+
+_STATUS_SQL = {
+    (status, scoped): _status_sql(status, scoped)
+    for status in DecisionStatus
+    for scoped in (False, True)
+}
 
 
 def fetch_by_status(
@@ -142,45 +243,13 @@ def fetch_by_status(
     limit: int | None = None,
 ) -> list[Decision]:
     if not isinstance(status, DecisionStatus):
-        try:
-            status = DecisionStatus(status)
-        except ValueError as e:
-            raise ValidationError(f"Unknown status: {status}") from e
-
-    conditions = ["d.deleted_at IS NULL", "d.archived_at IS NULL"]
-    params: list[str | int] = []
-
-    if project_id:
-        conditions.append("d.project_id = ?")
-        params.append(project_id)
-
-    if status == DecisionStatus.REJECTED:
-        conditions.append("d.rejected_at IS NOT NULL")
-    else:
-        conditions.append("d.rejected_at IS NULL")
-
-    if status == DecisionStatus.PROPOSED:
-        conditions.append("d.committed_at IS NULL")
-    elif status == DecisionStatus.COMMITTED:
-        conditions.append("d.committed_at IS NOT NULL")
-        conditions.append("d.actioned_at IS NULL")
-    elif status == DecisionStatus.ACTIONED:
-        conditions.append("d.committed_at IS NOT NULL")
-        conditions.append("d.actioned_at IS NOT NULL")
-        conditions.append(
-            "NOT EXISTS (SELECT 1 FROM insights i WHERE i.decision_id = d.id "
-            "AND i.deleted_at IS NULL AND i.created_at > d.actioned_at)"
-        )
-    elif status == DecisionStatus.LEARNED:
-        conditions.append("d.committed_at IS NOT NULL")
-        conditions.append("d.actioned_at IS NOT NULL")
-        conditions.append(
-            "EXISTS (SELECT 1 FROM insights i WHERE i.decision_id = d.id "
-            "AND i.deleted_at IS NULL AND i.created_at > d.actioned_at)"
-        )
+        coerced = _STATUS_BY_VALUE.get(status)
+        if coerced is None:
+            raise ValidationError(f"Unknown status: {status}")
+        status = coerced
 
-    where = " AND ".join(conditions)
-    sql = f"SELECT d.* FROM decisions d WHERE {where} ORDER BY d.created_at DESC"  # noqa: S608
+    sql = _STATUS_SQL[status, bool(project_id)]
+    params: list[str | int] = [project_id] if project_id else []
 
     if limit is not None:
         sql += " LIMIT ?"
@@ -189,7 +258,7 @@ def fetch_by_status(
     with store.ensure() as conn:
         rows = conn.execute(sql, params).fetchall()
 
-    return [store.from_row(row, Decision) for row in rows]
+    return store.from_rows(rows, Decision)
 
 
 def get_status(decision: Decision, linked_insights: list[Insight]) -> DecisionStatus:
@@ -223,11 +292,11 @@ def set_reversible(decision_id: DecisionId, reversible: bool) -> Decision:
             f"Decision '{decision_id}' already rejected - cannot change reversibility"
         )
     with store.write() as conn:
-        conn.execute(
-            "UPDATE decisions SET reversible = ? WHERE id = ?",
+        row = conn.execute(
+            "UPDATE decisions SET reversible = ? WHERE id = ? RETURNING *",
             (1 if reversible else 0, decision_id),
-        )
-    return get(decision_id)
+        ).fetchone()
+    return store.from_row(row, Decision)
 
 
 def commit(decision_id: DecisionId, at: str | None = None) -> Decision:
@@ -241,14 +310,16 @@ def commit(decision_id: DecisionId, at: str | None = None) -> Decision:
 
     now = at or datetime.now(UTC).isoformat()
     with store.write() as conn:
-        conn.execute(
-            "UPDATE decisions SET committed_at = ? WHERE id = ?",
+        row = conn.execute(
+            "UPDATE decisions SET committed_at = ? WHERE id = ? RETURNING *",
             (now, decision_id),
-        )
-    return get(decision_id)
+        ).fetchone()
+    return store.from_row(row, Decision)
 
 
-def reject(decision_id: DecisionId, at: str | None = None) -> Decision:
+def reject(
+    decision_id: DecisionId, at: str | None = None, reason: str | None = None
+) -> Decision:
     decision = get(decision_id)
     if decision.rejected_at:
         raise ValidationError(
@@ -259,11 +330,11 @@ def reject(decision_id: DecisionId, at: str | None = None) -> Decision:
 
     now = at or datetime.now(UTC).isoformat()
     with store.write() as conn:
-        conn.execute(
-            "UPDATE decisions SET rejected_at = ? WHERE id = ?",
-            (now, decision_id),
-        )
-    return get(decision_id)
+        row = conn.execute(
+            "UPDATE decisions SET rejected_at = ?, rejection_reason = ? WHERE id = ? RETURNING *",
+            (now, reason, decision_id),
+        ).fetchone()
+    return store.from_row(row, Decision)
 
 
 def uncommit(decision_id: DecisionId) -> Decision:
@@ -276,18 +347,18 @@ def uncommit(decision_id: DecisionId) -> Decision:
         raise ValidationError(f"Decision '{decision_id}' already rejected - cannot uncommit")
 
     with store.write() as conn:
-        conn.execute(
-            "UPDATE decisions SET committed_at = NULL WHERE id = ?",
+        row = conn.execute(
+            "UPDATE decisions SET committed_at = NULL WHERE id = ? RETURNING *",
             (decision_id,),
-        )
-    return get(decision_id)
+        ).fetchone()
+    return store.from_row(row, Decision)
 
 
 def decay_human_blocked(hours: int = 48) -> list[DecisionId]:
     with store.ensure() as conn:
         rows = conn.execute(
             """
-            SELECT id FROM decisions
+            SELECT * FROM decisions
             WHERE committed_at IS NOT NULL
               AND actioned_at IS NULL
               AND rejected_at IS NULL
@@ -298,20 +369,39 @@ def decay_human_blocked(hours: int = 48) -> list[DecisionId]:
             (hours,),
         ).fetchall()
 
-    decayed = []
-    for row in rows:
-        decision_id = DecisionId(row["id"])
-        decision = get(decision_id)
-        if is_human_blocked(decision):
-            uncommit(decision_id)
-            decayed.append(decision_id)
+    decayed = [
+        decision.id
+        for decision in store.from_rows(rows, Decision)
+        if is_human_blocked(decision)
+    ]
+    if not decayed:
+        return []
+
+    with store.write() as conn:
+        rows = conn.execute(
+            f"""
+            UPDATE decisions SET committed_at = NULL
+            WHERE id IN ({placeholders(decayed)})
+              AND committed_at IS NOT NULL
+              AND actioned_at IS NULL
+              AND rejected_at IS NULL
+            RETURNING id
+            """,  # noqa: S608
+            decayed,
+        ).fetchall()
+    updated = {row["id"] for row in rows}
+    return [decision_id for decision_id in decayed if decision_id in updated]
+
 
-    return decayed
+_COUNT_SQL = "SELECT COUNT(*) FROM decisions WHERE deleted_at IS NULL AND archived_at IS NULL"
+_COUNT_PROJECT_SQL = f"{_COUNT_SQL} AND project_id = ?"
 
 
 def count(project_id: ProjectId | None = None) -> int:
     with store.ensure() as conn:
-        return store.q("decisions").active().where_if("project_id = ?", project_id).count(conn)
+        if project_id is None:
+            return conn.execute(_COUNT_SQL).fetchone()[0]
+        return conn.execute(_COUNT_PROJECT_SQL, (project_id,)).fetchone()[0]
 
 
 def fetch_stale(
@@ -322,34 +412,45 @@ def fetch_stale(
 ) -> list[tuple[Decision, int]]:
     with store.ensure() as conn:
         params: list[str | int] = [min_age_hours, max_refs]
-
-        base_query = """
-            SELECT d.*,
-                (
-                    SELECT COUNT(*) FROM citations c
-                    WHERE c.target_type = 'decision' AND c.target_short_id = substr(d.id, 1, 8)
-                ) + (
-                    SELECT COUNT(*) FROM replies r
-                    WHERE r.parent_id = d.id AND r.deleted_at IS NULL
-                ) + (
-                    SELECT COUNT(*) FROM insights i2
-                    WHERE i2.decision_id = d.id AND i2.deleted_at IS NULL
-                ) as total_refs
-            FROM decisions d
-            WHERE d.committed_at IS NOT NULL
-              AND d.actioned_at IS NULL
-              AND d.rejected_at IS NULL
-              AND d.deleted_at IS NULL
-              AND d.archived_at IS NULL
-              AND (julianday('now') - julianday(d.committed_at)) * 24 >= ?
-        """
-
+        project_filter = "AND project_id = ?" if project_id else ""
         if project_id:
-            base_query += " AND d.project_id = ?"
             params.insert(1, project_id)
 
         query = f"""
-            SELECT * FROM ({base_query}) sub
+            WITH candidates AS (
+                SELECT * FROM decisions
+                WHERE committed_at IS NOT NULL
+                  AND actioned_at IS NULL
+                  AND rejected_at IS NULL
+                  AND deleted_at IS NULL
+                  AND archived_at IS NULL
+                  AND (julianday('now') - julianday(committed_at)) * 24 >= ?
+                  {project_filter}
+            ),
+            cite_counts AS (
+                SELECT target_short_id, COUNT(*) as n FROM citations
+                WHERE target_type = 'decision'
+                  AND target_short_id IN (SELECT substr(id, 1, 8) FROM candidates)
+                GROUP BY target_short_id
+            ),
+            reply_counts AS (
+                SELECT parent_id, COUNT(*) as n FROM replies
+                WHERE deleted_at IS NULL AND parent_id IN (SELECT id FROM candidates)
+                GROUP BY parent_id
+            ),
+            insight_counts AS (
+                SELECT decision_id, COUNT(*) as n FROM insights
+                WHERE deleted_at IS NULL AND decision_id IN (SELECT id FROM candidates)
+                GROUP BY decision_id
+            )
+            SELECT * FROM (
+                SELECT d.*,
+                       COALESCE(cc.n, 0) + COALESCE(rc.n, 0) + COALESCE(ic.n, 0) as total_refs
+                FROM candidates d
+                LEFT JOIN cite_counts cc ON cc.target_short_id = substr(d.id, 1, 8)
+                LEFT JOIN reply_counts rc ON rc.parent_id = d.id
+                LEFT JOIN insight_counts ic ON ic.decision_id = d.id
+            )
             WHERE total_refs <= ?
             ORDER BY total_refs ASC, committed_at ASC LIMIT {limit}
         """  # noqa: S608
@@ -364,21 +465,17 @@ def fetch_rejected_with_reasons(
     with store.ensure() as conn:
         params: list[str | int] = [max_age_days]
         query = """
-            SELECT d.*, r.content as reason
-            FROM decisions d
-            LEFT JOIN replies r ON r.parent_id = d.id
-                AND r.content LIKE 'Rejected:%'
-                AND r.deleted_at IS NULL
-            WHERE d.rejected_at IS NOT NULL
-                AND d.deleted_at IS NULL
-                AND d.archived_at IS NULL
-                AND julianday('now') - julianday(d.rejected_at) <= ?
+            SELECT * FROM decisions
+            WHERE rejected_at IS NOT NULL
+                AND deleted_at IS NULL
+                AND archived_at IS NULL
+                AND julianday('now') - julianday(rejected_at) <= ?
         """
         if project_id:
-            query += " AND d.project_id = ?"
+            query += " AND project_id = ?"
             params.append(project_id)
 
-        query += " ORDER BY d.rejected_at DESC"
+        query += " ORDER BY rejected_at DESC"
 
         if limit:
             query += " LIMIT ?"
@@ -386,14 +483,8 @@ def fetch_rejected_with_reasons(
 
         rows = conn.execute(query, params).fetchall()
 
-    results: list[tuple[Decision, str | None]] = []
-    for row in rows:
-        decision = store.from_row(dict(row), Decision)
-        reason = row["reason"]
-        if reason and reason.startswith("Rejected: "):
-            reason = reason[10:]
-        results.append((decision, reason))
-    return results
+    decisions = store.from_rows(rows, Decision)
+    return [(decision, decision.rejection_reason) for decision in decisions]
 
 
 def fetch_calibration(project_id: ProjectId | None = None, limit: int = 50) -> list[Decision]:
@@ -417,4 +508,4 @@ def fetch_calibration(project_id: ProjectId | None = None, limit: int = 50) -> l
             params.append(limit)
 
         rows = conn.execute(query, params).fetchall()
-    return [store.from_row(row, Decision) for row in rows]
+    return store.from_rows(rows, Decision)
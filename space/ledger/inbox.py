@@ -385,16 +385,29 @@ def mark_read(
     agent_id: AgentId,
     spawn_id: SpawnId | None = None,
 ) -> None:
+    mark_read_many([(artifact_type, artifact_id)], agent_id, spawn_id)
+
+
+def mark_read_many(
+    artifacts: list[tuple[ArtifactType, str]],
+    agent_id: AgentId,
+    spawn_id: SpawnId | None = None,
+) -> None:
+    if not artifacts:
+        return
     now = datetime.now(UTC).isoformat()
     with store.write() as conn:
-        conn.execute(
+        conn.executemany(
             """
             INSERT INTO artifact_reads (artifact_type, artifact_id, agent_id, spawn_id, read_at)
             VALUES (?, ?, ?, ?, ?)
             ON CONFLICT(artifact_type, artifact_id, agent_id)
             DO UPDATE SET read_at = excluded.read_at, spawn_id = excluded.spawn_id
             """,
-            (artifact_type, artifact_id, agent_id, spawn_id, now),
+            [
+                (artifact_type, artifact_id, agent_id, spawn_id, now)
+                for artifact_type, artifact_id in artifacts
+            ],
         )
 
 
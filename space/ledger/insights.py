@@ -83,12 +83,12 @@ def create(
                     f"Decision '{decision_id}' not found — cannot link insight to nonexistent decision"
                 )
 
-    insight_id = InsightId(ids.generate("insights"))
     now = datetime.now(UTC).isoformat()
     mentions = replies.parse_mentions(content)
     provenance = _compute_provenance(content, agent_id)
 
     with store.write() as conn:
+        insight_id = InsightId(ids.generate("insights", conn))
         store.unarchive("agents", agent_id, conn)
         if decision_id:
             store.unarchive("decisions", decision_id, conn)
@@ -1,8 +1,8 @@
 
-import sqlite3
 from dataclasses import dataclass
 from typing import Any, Literal
 
+from space.core.models import Decision
 from space.core.types import AgentId, DecisionId, InsightId, ProjectId, TaskId
 from space.lib import store
 from space.lib.store.resolve import by_prefix
@@ -23,6 +23,7 @@ class LedgerItem:
     decision_id: DecisionId | None = None
     decision_content: str | None = None
     reply_count: int = 0
+    decision: Decision | None = None
 
 
 def _item_from_row(row: dict[str, Any]) -> LedgerItem:
@@ -41,19 +42,37 @@ def _item_from_row(row: dict[str, Any]) -> LedgerItem:
     )
 
 
-def _fetch_replies(conn: sqlite3.Connection, parent_type: str, parent_id: str) -> list[LedgerItem]:
-    rows = conn.execute(
-        """
+def _replies_sql(parent_type: str) -> str:
+    return f"""
         SELECT 'reply' as type, r.id, r.content, NULL as rationale, NULL as status,
-               r.author_id as agent_id, a.handle, r.created_at
+               r.author_id as agent_id, a.handle, r.created_at,
+               NULL as decision_id, NULL as decision_content
         FROM replies r
         JOIN agents a ON r.author_id = a.id
-        WHERE r.parent_type = ? AND r.parent_id = ? AND r.deleted_at IS NULL
-        ORDER BY r.created_at ASC
-        """,
-        (parent_type, parent_id),
-    ).fetchall()
-    return [_item_from_row(dict(row)) for row in rows]
+        WHERE r.parent_type = '{parent_type}' AND r.parent_id = ? AND r.deleted_at IS NULL
+    """  # noqa: S608
+
+
+def _thread_query(main_sql: str, related_sql: str, params: tuple[str, ...]) -> list[Any]:
+    with store.ensure() as conn:
+        return conn.execute(
+            f"""
+            SELECT 0 as pos, * FROM ({main_sql})
+            UNION ALL
+            SELECT 1, * FROM ({related_sql})
+            ORDER BY pos, created_at ASC
+            """,  # noqa: S608
+            params,
+        ).fetchall()
+
+
+def _thread_rows(
+    main_sql: str, related_sql: str, params: tuple[str, ...]
+) -> tuple[LedgerItem | None, list[LedgerItem]]:
+    rows = _thread_query(main_sql, related_sql, params)
+    if not rows or rows[0]["pos"] != 0:
+        return None, []
+    return _item_from_row(dict(rows[0])), [_item_from_row(dict(row)) for row in rows[1:]]
 
 
 def fetch(limit: int = 50, project_id: ProjectId | None = None) -> list[LedgerItem]:
@@ -117,92 +136,72 @@ def thread(item_type: str, item_id: str) -> tuple[LedgerItem | None, list[Ledger
     return None, []
 
 
-def _decision_thread(decision_id: DecisionId) -> tuple[LedgerItem | None, list[LedgerItem]]:
-    with store.ensure() as conn:
-        dec_row = conn.execute(
-            """
-            SELECT 'decision' as type, d.id, d.content, d.rationale, NULL as status,
-                   d.agent_id, a.handle, d.created_at, NULL as decision_id, NULL as decision_content
-            FROM decisions d
-            JOIN agents a ON d.agent_id = a.id
-            WHERE d.id = ? AND d.deleted_at IS NULL
-            """,
-            (decision_id,),
-        ).fetchone()
-
-        if not dec_row:
-            return None, []
+_DECISION_MAIN_SQL = """
+    SELECT 'decision' as type, d.id, d.content, d.rationale, NULL as status,
+           d.agent_id, a.handle, d.created_at, NULL as decision_id, NULL as decision_content,
+           d.project_id, d.spawn_id, d.expected_outcome, d.reversible, d.outcome, d.refs,
+           d.images, d.committed_at, d.actioned_at, d.rejected_at, d.rejection_reason
+    FROM decisions d
+    JOIN agents a ON d.agent_id = a.id
+    WHERE d.id = ? AND d.deleted_at IS NULL
+"""
+
+_DECISION_LINKED_SQL = f"""
+    SELECT 'insight' as type, i.id, i.content, NULL as rationale, NULL as status,
+           i.agent_id, a.handle, i.created_at, NULL as decision_id, NULL as decision_content
+    FROM insights i
+    JOIN agents a ON i.agent_id = a.id
+    WHERE i.decision_id = ? AND i.deleted_at IS NULL
+    UNION ALL
+    SELECT 'task', t.id, t.content, NULL, t.status,
+           t.creator_id, a.handle, t.created_at, NULL, NULL
+    FROM tasks t
+    JOIN agents a ON t.creator_id = a.id
+    WHERE t.decision_id = ?
+    UNION ALL
+    {_replies_sql("decision")}
+"""  # noqa: S608
+
+_DECISION_RELATED_SQL = f"""
+    SELECT *, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+    FROM ({_DECISION_LINKED_SQL})
+"""  # noqa: S608
+
+_INSIGHT_MAIN_SQL = """
+    SELECT 'insight' as type, i.id, i.content, NULL as rationale, NULL as status,
+           i.agent_id, a.handle, i.created_at, i.decision_id, d.content as decision_content
+    FROM insights i
+    JOIN agents a ON i.agent_id = a.id
+    LEFT JOIN decisions d ON i.decision_id = d.id
+    WHERE i.id = ? AND i.deleted_at IS NULL
+"""
+
+_TASK_MAIN_SQL = """
+    SELECT 'task' as type, t.id, t.content, NULL as rationale, t.status,
+           t.creator_id as agent_id, a.handle, t.created_at, t.decision_id,
+           d.content as decision_content
+    FROM tasks t
+    JOIN agents a ON t.creator_id = a.id
+    LEFT JOIN decisions d ON t.decision_id = d.id
+    WHERE t.id = ?
+"""
 
-        linked = conn.execute(
-            """
-            SELECT * FROM (
-                SELECT 'insight' as type, i.id, i.content, NULL as rationale, NULL as status,
-                       i.agent_id, a.handle, i.created_at
-                FROM insights i
-                JOIN agents a ON i.agent_id = a.id
-                WHERE i.decision_id = ? AND i.deleted_at IS NULL
-                UNION ALL
-                SELECT 'task', t.id, t.content, NULL, t.status,
-                       t.creator_id, a.handle, t.created_at
-                FROM tasks t
-                JOIN agents a ON t.creator_id = a.id
-                WHERE t.decision_id = ?
-                UNION ALL
-                SELECT 'reply', r.id, r.content, NULL, NULL,
-                       r.author_id, a.handle, r.created_at
-                FROM replies r
-                JOIN agents a ON r.author_id = a.id
-                WHERE r.parent_type = 'decision' AND r.parent_id = ?
-                    AND r.deleted_at IS NULL
-            )
-            ORDER BY created_at ASC
-            """,
-            (decision_id, decision_id, decision_id),
-        ).fetchall()
 
-    return _item_from_row(dict(dec_row)), [_item_from_row(dict(row)) for row in linked]
+def _decision_thread(decision_id: DecisionId) -> tuple[LedgerItem | None, list[LedgerItem]]:
+    rows = _thread_query(
+        _DECISION_MAIN_SQL, _DECISION_RELATED_SQL, (decision_id, decision_id, decision_id, decision_id)
+    )
+    if not rows or rows[0]["pos"] != 0:
+        return None, []
+    main_row = dict(rows[0])
+    main = _item_from_row(main_row)
+    main.decision = store.from_row(main_row, Decision)
+    return main, [_item_from_row(dict(row)) for row in rows[1:]]
 
 
 def _insight_thread(insight_id: InsightId) -> tuple[LedgerItem | None, list[LedgerItem]]:
-    with store.ensure() as conn:
-        ins_row = conn.execute(
-            """
-            SELECT 'insight' as type, i.id, i.content, NULL as rationale, NULL as status,
-                   i.agent_id, a.handle, i.created_at, i.decision_id, d.content as decision_content
-            FROM insights i
-            JOIN agents a ON i.agent_id = a.id
-            LEFT JOIN decisions d ON i.decision_id = d.id
-            WHERE i.id = ? AND i.deleted_at IS NULL
-            """,
-            (insight_id,),
-        ).fetchone()
-
-        if not ins_row:
-            return None, []
-
-        replies = _fetch_replies(conn, "insight", insight_id)
-
-    return _item_from_row(dict(ins_row)), replies
+    return _thread_rows(_INSIGHT_MAIN_SQL, _replies_sql("insight"), (insight_id, insight_id))
 
 
 def _task_thread(task_id: TaskId) -> tuple[LedgerItem | None, list[LedgerItem]]:
-    with store.ensure() as conn:
-        task_row = conn.execute(
-            """
-            SELECT 'task' as type, t.id, t.content, NULL as rationale, t.status,
-                   t.creator_id as agent_id, a.handle, t.created_at, t.decision_id,
-                   d.content as decision_content
-            FROM tasks t
-            JOIN agents a ON t.creator_id = a.id
-            LEFT JOIN decisions d ON t.decision_id = d.id
-            WHERE t.id = ?
-            """,
-            (task_id,),
-        ).fetchone()
-
-        if not task_row:
-            return None, []
-
-        replies = _fetch_replies(conn, "task", task_id)
-
-    return _item_from_row(dict(task_row)), replies
+    return _thread_rows(_TASK_MAIN_SQL, _replies_sql("task"), (task_id, task_id))
@@ -115,14 +115,14 @@ def fetch(include_archived: bool = False) -> list[Project]:
     return [store.from_row(row, Project) for row in rows]
 
 
-def batch_last_active(project_ids: list[ProjectId]) -> dict[ProjectId, str | None]:
+def batch_stats(project_ids: list[ProjectId]) -> dict[ProjectId, tuple[str | None, int]]:
     if not project_ids:
         return {}
     ph = ",".join("?" * len(project_ids))
     with store.ensure() as conn:
         rows = conn.execute(
             f"""
-            SELECT project_id, MAX(created_at) AS ts FROM (
+            SELECT project_id, MAX(created_at) AS ts, COUNT(*) AS cnt FROM (
                 SELECT project_id, created_at FROM insights WHERE project_id IN ({ph}) AND deleted_at IS NULL
                 UNION ALL
                 SELECT project_id, created_at FROM decisions WHERE project_id IN ({ph}) AND deleted_at IS NULL
@@ -132,27 +132,40 @@ def batch_last_active(project_ids: list[ProjectId]) -> dict[ProjectId, str | Non
             """,  # noqa: S608
             project_ids * 3,
         ).fetchall()
-    return {ProjectId(row[0]): row[1] for row in rows if row and row[0]}
+    return {ProjectId(row[0]): (row[1], row[2]) for row in rows if row and row[0]}
+
+
+def batch_last_active(project_ids: list[ProjectId]) -> dict[ProjectId, str | None]:
+    return {pid: ts for pid, (ts, _) in batch_stats(project_ids).items()}
 
 
 def batch_artifact_counts(project_ids: list[ProjectId]) -> dict[ProjectId, int]:
-    if not project_ids:
-        return {}
-    ph = ",".join("?" * len(project_ids))
+    return {pid: cnt for pid, (_, cnt) in batch_stats(project_ids).items()}
+
+
+def fetch_with_stats(include_archived: bool = False) -> list[tuple[Project, str | None, int]]:
+    where = "" if include_archived else "WHERE p.archived_at IS NULL"
     with store.ensure() as conn:
         rows = conn.execute(
             f"""
-            SELECT project_id, COUNT(*) as cnt FROM (
-                SELECT project_id FROM insights WHERE project_id IN ({ph}) AND deleted_at IS NULL
-                UNION ALL
-                SELECT project_id FROM decisions WHERE project_id IN ({ph}) AND deleted_at IS NULL
-                UNION ALL
-                SELECT project_id FROM tasks WHERE project_id IN ({ph}) AND deleted_at IS NULL
-            ) GROUP BY project_id
-            """,  # noqa: S608
-            project_ids * 3,
+            SELECT p.*, s.last_active AS last_active, COALESCE(s.cnt, 0) AS artifact_count
+            FROM projects p
+            LEFT JOIN (
+                SELECT project_id, MAX(created_at) AS last_active, COUNT(*) AS cnt FROM (
+                    SELECT project_id, created_at FROM insights WHERE deleted_at IS NULL
+                    UNION ALL
+                    SELECT project_id, created_at FROM decisions WHERE deleted_at IS NULL
+                    UNION ALL
+                    SELECT project_id, created_at FROM tasks WHERE deleted_at IS NULL
+                ) GROUP BY project_id
+            ) s ON s.project_id = p.id
+            {where}
+            ORDER BY COALESCE(s.last_active, p.created_at, '') DESC, p.name DESC
+            """  # noqa: S608
         ).fetchall()
-    return {ProjectId(row[0]): row[1] for row in rows if row and row[0]}
+    return [
+        (store.from_row(row, Project), row["last_active"], row["artifact_count"]) for row in rows
+    ]
 
 
 def last_active(project_id: ProjectId) -> str | None:
@@ -83,10 +83,10 @@ def create(
     parent_type, full_parent_id = resolve_parent_type(parent_id)
     mentions = _expand_aliases(parse_mentions(content))
 
-    reply_id = ReplyId(ids.generate("replies"))
     now = datetime.now(UTC).isoformat()
 
     with store.write() as conn:
+        reply_id = ReplyId(ids.generate("replies", conn))
         store.unarchive("agents", author_id, conn)
         conn.execute(
             "INSERT INTO replies (id, parent_type, parent_id, author_id, spawn_id, project_id, content, mentions, images, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -18,11 +18,11 @@ def create(
     done: bool = False,
     result: str | None = None,
 ) -> Task:
-    task_id = TaskId(ids.generate("tasks"))
     now = datetime.now(UTC).isoformat()
     status = TaskStatus.DONE if done else TaskStatus.PENDING
     assignee = creator_id if done else assignee_id
     with store.write() as conn:
+        task_id = TaskId(ids.generate("tasks", conn))
         if decision_id:
             store.unarchive("decisions", decision_id, conn)
         conn.execute(
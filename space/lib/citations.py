@@ -44,6 +44,32 @@ def store(
     return stored
 
 
+def store_many(
+    conn: sqlite3.Connection,
+    source_type: SourceType,
+    sources: list[tuple[str, str]],
+) -> int:
+    rows = [
+        (source_type, source_id, target_type, short_id)
+        for source_id, text in sources
+        for target_type, short_id in extract(text)
+    ]
+    if not rows:
+        return 0
+
+    try:
+        cursor = conn.executemany(
+            """
+            INSERT OR IGNORE INTO citations (source_type, source_id, target_type, target_short_id)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+    except sqlite3.Error:
+        return 0
+    return cursor.rowcount
+
+
 def count_refs(conn: sqlite3.Connection, target_type: TargetType, short_id: str) -> int:
     row = conn.execute(
         "SELECT COUNT(*) FROM citations WHERE target_type = ? AND target_short_id = ?",
@@ -67,6 +67,17 @@ def strip_markdown(text: str) -> str:
     return _MD_EMOJI_RE.sub("", text)
 
 
+_MD_TRIGGER_RE = re.compile(r"[*`#\[✅🔲⬜]")
+
+
+def plain(text: str) -> str:
+    if "\x1b" in text:
+        text = _ANSI_RE.sub("", text)
+    if _MD_TRIGGER_RE.search(text):
+        text = strip_markdown(text)
+    return text
+
+
 def red(text: str) -> str:
     return f"{_active.red}{text}{_active.reset}"
 
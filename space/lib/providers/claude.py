@@ -104,6 +104,9 @@ def _usage_event(msg: dict[str, Any], identity: str, timestamp: str | None) -> P
     )
 
 
+NORMALIZED_TYPES = frozenset({"context_init", "state_change", "assistant", "user"})
+
+
 def normalize_event(
     event: dict[str, Any], identity: str, tool_map: dict[str, str] | None = None
 ) -> list[ProviderEvent]:
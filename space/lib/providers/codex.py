@@ -33,6 +33,9 @@ def build_command(
     return args, context
 
 
+NORMALIZED_TYPES = frozenset({"item.started", "item.completed", "turn.completed"})
+
+
 def normalize_event(
     event: dict[str, Any], identity: str, tool_map: dict[str, str] | None = None
 ) -> list[ProviderEvent]:
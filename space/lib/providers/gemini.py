@@ -43,6 +43,9 @@ def build_command(
     return args, None
 
 
+NORMALIZED_TYPES = frozenset({"message", "tool_use", "tool_result", "result"})
+
+
 def normalize_event(
     event: dict[str, Any], identity: str, tool_map: dict[str, str] | None = None
 ) -> list[ProviderEvent]:
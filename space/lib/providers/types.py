@@ -98,6 +98,8 @@ class UsageStats:
 
 
 class Provider(Protocol):
+    NORMALIZED_TYPES: frozenset[str]
+
     @staticmethod
     def normalize_event(
         event: dict[str, Any], identity: str, tool_map: dict[str, str] | None = None
@@ -8,6 +8,7 @@ from space.lib.store.connection import (
     ensure,
     existing,
     from_row,
+    from_rows,
     set_test_db_path,
     transaction,
     unarchive,
@@ -32,7 +33,14 @@ from space.lib.store.resolve import (
     resolve_short,
     strip_prefix,
 )
-from space.lib.store.sqlite import checkpoint_wal, connect, fts_search, fts_tokenize, placeholders
+from space.lib.store.sqlite import (
+    checkpoint_wal,
+    connect,
+    fts_search,
+    fts_tokenize,
+    placeholders,
+    prefix_range,
+)
 
 __all__ = [
     "ARCHIVABLE_TABLES",
@@ -54,10 +62,12 @@ __all__ = [
     "ensure",
     "existing",
     "from_row",
+    "from_rows",
     "fts_search",
     "fts_tokenize",
     "get_backup_stats",
     "placeholders",
+    "prefix_range",
     "q",
     "ref",
     "repair_fts_if_needed",
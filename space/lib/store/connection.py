@@ -3,10 +3,11 @@ import json
 import sqlite3
 import threading
 import weakref
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager, suppress
 from dataclasses import fields
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, Literal, Protocol, get_args, get_origin
 
@@ -55,9 +56,11 @@ class DataclassInstance(Protocol):
     __dataclass_fields__: ClassVar[dict[str, Any]]
 
 
-def _coerce_value(value: Any, field_type: Any) -> Any:
-    if value is None:
-        return None
+def _load_json_list(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _converter(field_type: Any) -> Callable[[Any], Any] | None:
     origin = get_origin(field_type)
     if origin is not None:
         args = get_args(field_type)
@@ -66,22 +69,58 @@ def _coerce_value(value: Any, field_type: Any) -> Any:
             field_type = non_none[0]
             origin = get_origin(field_type)
     if isinstance(field_type, type) and issubclass(field_type, Enum):
-        return field_type(value)
+        return field_type
     if field_type is bool:
-        return bool(value)
-    if origin is list and isinstance(value, str):
-        return json.loads(value)
-    return value
+        return bool
+    if origin is list:
+        return _load_json_list
+    return None
+
+
+@lru_cache(maxsize=256)
+def _row_plan(
+    dataclass_type: type, columns: tuple[str, ...]
+) -> tuple[tuple[tuple[str, int, Callable[[Any], Any] | None], ...], bool]:
+    index = {column: i for i, column in enumerate(columns)}
+    dataclass_fields = fields(dataclass_type)
+    plan = tuple(
+        (f.name, index[f.name], _converter(f.type)) for f in dataclass_fields if f.name in index
+    )
+    positional = len(plan) == len(dataclass_fields) and all(
+        f.init and not f.kw_only for f in dataclass_fields
+    )
+    return plan, positional
+
+
+def _build[T: DataclassInstance](
+    values: Any,
+    plan: tuple[tuple[str, int, Callable[[Any], Any] | None], ...],
+    positional: bool,
+    dataclass_type: type[T],
+) -> T:
+    args: list[Any] = []
+    for _, i, convert in plan:
+        value = values[i]
+        args.append(convert(value) if convert is not None and value is not None else value)
+    if positional:
+        return dataclass_type(*args)
+    return dataclass_type(**{name: arg for (name, _, _), arg in zip(plan, args, strict=True)})
 
 
 def from_row[T: DataclassInstance](row: dict[str, Any] | Any, dataclass_type: type[T]) -> T:
-    row_dict: dict[str, Any] = dict(row) if not isinstance(row, dict) else row
-    field_info = {f.name: f.type for f in fields(dataclass_type)}
-    kwargs: dict[str, Any] = {}
-    for name, ftype in field_info.items():
-        if name in row_dict:
-            kwargs[name] = _coerce_value(row_dict[name], ftype)
-    return dataclass_type(**kwargs)
+    if isinstance(row, dict):
+        columns, values = tuple(row), tuple(row.values())
+    else:
+        columns, values = tuple(row.keys()), row
+    plan, positional = _row_plan(dataclass_type, columns)
+    return _build(values, plan, positional, dataclass_type)
+
+
+def from_rows[T: DataclassInstance](rows: list[Row], dataclass_type: type[T]) -> list[T]:
+    if not rows:
+        return []
+    plan, positional = _row_plan(dataclass_type, tuple(rows[0].keys()))
+    return [_build(row, plan, positional, dataclass_type) for row in rows]
 
 
 class _ConnContext:
@@ -124,8 +124,7 @@ def migrate(conn: sqlite3.Connection, migs: Sequence[Migration]) -> None:
     conn.execute("CREATE TABLE IF NOT EXISTS _migrations (name TEXT PRIMARY KEY)")
     conn.commit()
 
-    applied_rows = conn.execute("SELECT name FROM _migrations").fetchall()
-    applied = {row[0] for row in applied_rows}
+    applied = {row[0] for row in conn.execute("SELECT name FROM _migrations")}
     pending = [(name, migration) for name, migration in migs if name not in applied]
     if not pending:
         return
@@ -142,7 +141,7 @@ def migrate(conn: sqlite3.Connection, migs: Sequence[Migration]) -> None:
                 cursor = conn.execute(
                     "SELECT name FROM sqlite_master WHERE type='table' AND name != '_migrations' AND name != 'sqlite_sequence' AND name NOT LIKE '%_fts%'"
                 )
-                tables = [row[0] for row in cursor.fetchall()]
+                tables = [row[0] for row in cursor]
                 before = {t: _get_table_count(conn, t) for t in tables}
 
                 if callable(migration):
@@ -4,7 +4,7 @@ import sqlite3
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
-from space.lib.store.connection import DataclassInstance, from_row
+from space.lib.store.connection import DataclassInstance, from_row, from_rows
 
 T = TypeVar("T", bound=DataclassInstance)
 
@@ -117,7 +117,7 @@ class Query:
         return conn.execute(sql, params).fetchall()
 
     def fetch(self, conn: sqlite3.Connection, cls: type[T]) -> list[T]:
-        return [from_row(row, cls) for row in self.execute(conn)]
+        return from_rows(self.execute(conn), cls)
 
     def fetch_one(self, conn: sqlite3.Connection, cls: type[T]) -> T | None:
         rows = self.limit(1).execute(conn)
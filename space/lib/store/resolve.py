@@ -48,8 +48,22 @@ def _is_full_id(ref: str) -> bool:
     return len(ref) >= UUID_LENGTH
 
 
-def _escape_like(ref: str) -> str:
-    return ref.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+def _unique_prefix_row(
+    c: sqlite3.Connection, ref: str, table: str, id_column: str
+) -> sqlite3.Row | None:
+    matches = c.execute(
+        f"SELECT * FROM {table} WHERE {id_column} >= ? AND {id_column} < ? LIMIT 2",  # noqa: S608
+        store.prefix_range(ref.lower()),
+    ).fetchall()
+    if len(matches) == 1:
+        return matches[0]
+    if len(matches) > 1:
+        exact = next((m for m in matches if m[0] == ref), None)
+        if exact:
+            return exact
+        sample = [m[0] for m in matches[:3]]
+        raise ReferenceError(ref, 2, sample)
+    return None
 
 
 def by_prefix[T: str](
@@ -79,19 +93,7 @@ def row_by_prefix(
             ).fetchone()
 
         if len(ref) >= SHORT_ID_LENGTH:
-            like_ref = _escape_like(ref)
-            matches = c.execute(
-                f"SELECT * FROM {table} WHERE {id_column} LIKE ? ESCAPE '\\' LIMIT 2",  # noqa: S608
-                (f"{like_ref}%",),
-            ).fetchall()
-            if len(matches) == 1:
-                return matches[0]
-            if len(matches) > 1:
-                exact = next((m for m in matches if m[0] == ref), None)
-                if exact:
-                    return exact
-                sample = [m[0] for m in matches[:3]]
-                raise ReferenceError(ref, 2, sample)
+            return _unique_prefix_row(c, ref, table, id_column)
         return None
 
     if conn:
@@ -136,19 +138,7 @@ def row_by_alt_key(
             return row
 
         if len(ref) >= SHORT_ID_LENGTH:
-            like_ref = _escape_like(ref)
-            matches = c.execute(
-                f"SELECT * FROM {table} WHERE {id_column} LIKE ? ESCAPE '\\' LIMIT 2",  # noqa: S608
-                (f"{like_ref}%",),
-            ).fetchall()
-            if len(matches) == 1:
-                return matches[0]
-            if len(matches) > 1:
-                exact = next((m for m in matches if m[0] == ref), None)
-                if exact:
-                    return exact
-                sample = [m[0] for m in matches[:3]]
-                raise ReferenceError(ref, 2, sample)
+            return _unique_prefix_row(c, ref, table, id_column)
         return None
 
     if conn:
@@ -18,19 +18,34 @@ logger = logging.getLogger(__name__)
 
 CONN_SLOW_SECS = 0.1
 CHECKPOINT_SECS = 60.0
+STATEMENT_CACHE_SIZE = 256
 _checkpoint_lock = threading.Lock()
 _last_checkpoint: dict[str, float] = {}
 
 
+def _tune(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")
+
+
 def connect(db_path: Path) -> sqlite3.Connection:
     start = time.perf_counter()
 
-    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0, factory=SpaceConnection)
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        timeout=5.0,
+        factory=SpaceConnection,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
     conn.isolation_level = None
 
     conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    _tune(conn)
 
     elapsed = time.perf_counter() - start
     if elapsed > CONN_SLOW_SECS:
@@ -43,12 +58,17 @@ def connect_readonly(db_path: Path) -> sqlite3.Connection:
     start = time.perf_counter()
 
     conn = sqlite3.connect(
-        f"file:{db_path}?mode=ro", uri=True, check_same_thread=False, factory=SpaceConnection
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        factory=SpaceConnection,
+        cached_statements=STATEMENT_CACHE_SIZE,
     )
     conn.row_factory = sqlite3.Row
     conn.isolation_level = None
 
     conn.execute("PRAGMA foreign_keys = ON")
+    _tune(conn)
 
     elapsed = time.perf_counter() - start
     if elapsed > CONN_SLOW_SECS:
@@ -92,6 +112,10 @@ def placeholders(items: Sized) -> str:
     return ",".join("?" * len(items))
 
 
+def prefix_range(prefix: str) -> tuple[str, str]:
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
 def fts_tokenize(text: str) -> list[str]:
     return re.findall(r"[a-z0-9]+", text.lower())
 
@@ -1,6 +1,8 @@
 import argparse
 import sys
 
+from space.ledger.args import add_actions as add_ledger_actions
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -28,30 +30,7 @@ def main() -> None:
     at_p.add_argument("-j", "--json", action="store_true", help="output as JSON")
 
     ledger_p = subs.add_parser("ledger", help="unified ledger access")
-    ledger_p.add_argument(
-        "action",
-        choices=[
-            "add",
-            "list",
-            "show",
-            "inbox",
-            "commit",
-            "reject",
-            "action",
-            "search",
-            "close",
-            "cancel",
-        ],
-        help="ledger action",
-    )
-    ledger_p.add_argument("artifact", nargs="*", help="artifact type/ref/content")
-    ledger_p.add_argument("-d", "--domain", help="domain for insight add")
-    ledger_p.add_argument("-w", "--why", help="rationale for decision add")
-    ledger_p.add_argument("-r", "--refs", help="references for decision add")
-    ledger_p.add_argument("-o", "--outcome", help="outcome for decision action")
-    ledger_p.add_argument("-n", "--limit", type=int, default=20, help="search result limit")
-    ledger_p.add_argument("-g", "--all-projects", action="store_true", help="search all projects")
-    ledger_p.add_argument("-j", "--json", action="store_true", help="output as JSON")
+    add_ledger_actions(ledger_p)
 
     swarm_p = subs.add_parser("swarm", help="autonomous agent spawning")
     swarm_subs = swarm_p.add_subparsers(dest="swarm_cmd", help="swarm command")